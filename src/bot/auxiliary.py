@@ -1,20 +1,140 @@
 from datetime import datetime
-from typing import Union
-from collections import namedtuple
-from sqlite3 import connect
+from time import monotonic, sleep
+from typing import Union, Iterator, NamedTuple, Any
+from enum import IntFlag
+from functools import lru_cache
+from contextlib import contextmanager
+from threading import RLock, Lock
+from queue import Queue
+from sqlite3 import connect, Connection, Cursor
 
-from config import LANGUAGES, DATABASE
+from config import (LANGUAGES, DATABASE, CACHED_STATEMENTS, DATABASE_PRAGMAS, READING_CONNECTIONS, CACHED_CHAT_RECORDS,
+                    CACHED_SORT_KEYS, REFERENCE_DATA_TTL, GROUP_DATA_TTLS)
 import log
 
-ChatRecord = namedtuple(
-    'ChatRecord',
-    ('id', 'type', 'username', 'language', 'group_id', 'role', 'familiarity', 'feedback', 'registered')
-)
-Familiarity = namedtuple(  # familiarity with the bot's interactions
-    'Familiarity',
-    ('commands', 'trust', 'distrust', 'new', 'cancel', 'event_answer', 'save', 'delete', 'clear', 'tell', 'ask',
-     'answer', 'resign', 'feedback', 'leave')
-)
+
+class Familiarity(IntFlag):  # familiarity with the bot's interactions, each bit is set once the user is familiar
+    commands = 1 << 0
+    trust = 1 << 1
+    distrust = 1 << 2
+    new = 1 << 3
+    cancel = 1 << 4
+    event_answer = 1 << 5
+    save = 1 << 6
+    delete = 1 << 7
+    clear = 1 << 8
+    tell = 1 << 9
+    ask = 1 << 10
+    answer = 1 << 11
+    resign = 1 << 12
+    feedback = 1 << 13
+    leave = 1 << 14
+
+
+class ChatRecord(NamedTuple):
+    id: int
+    type: int
+    username: str
+    language: int
+    group_id: int
+    role: int
+    familiarity: Familiarity  # parsed once, when the record is read, group chats have none stored
+    feedback: Union[str, None]
+    registered: str
+
+
+def open_connection() -> Connection:
+    """
+    Returns (sqlite3.Connection): connection to the database that can be used by any thread, with
+        src.bot.config.DATABASE_PRAGMAS applied and ALPHABETICAL collation (see src.bot.auxiliary.str_sort_key)
+        created.
+    """
+    new_connection = connect(DATABASE, check_same_thread=False, cached_statements=CACHED_STATEMENTS)
+    for pragma in DATABASE_PRAGMAS:
+        new_connection.execute(f'PRAGMA {pragma}')
+    new_connection.create_collation('ALPHABETICAL', lambda s1, s2: str_sort_key(s1) - str_sort_key(s2))
+    return new_connection
+
+
+# shared by the communication and notification threads, so prepared statements are reused
+connection = open_connection()
+connection_lock = RLock()
+reading_connections = Queue()  # connections that are only read through, free ones are in the queue
+for _ in range(READING_CONNECTIONS):
+    reading_connections.put(open_connection())
+chat_records: dict[int, ChatRecord] = {}  # records of registered chats by their ids, the earliest cached are first
+related_chat_records: dict[int, list[ChatRecord]] = {}  # records of chats related to groups, by ids of the groups
+reference_data: dict[tuple, tuple[float, Any]] = {}  # cities, EDUs and departments by keys, with when they expire
+group_data: dict[tuple[str, int], tuple[float, Union[str, None]]] = {}  # groups' events and info, with when they expire
+data_lock = Lock()  # for the cache above, as it is also changed by the notification thread
+
+# letters of Ukrainian, English and Russian in their alphabetical order, lowercase and uppercase ones have same indices
+LETTER_INDICES = {
+    letter: index for index, lowercase in enumerate('abcdefghijklmnopqrstuvwxyzабвгґдеєёжзиіїйклмнопрстуфхцчшщъыьэюя')
+    for letter in (lowercase, lowercase.upper())
+}
+ZERO, ZERO_11 = ord('0'), ord('0') * 11  # ord(d1) * 10 + ord(d2) - ZERO_11 is the value of two-digit number d1d2
+
+
+@contextmanager
+def database_cursor() -> Iterator[Cursor]:
+    """
+    This function provides access to the database through the connection that is shared by all threads, so that a new
+    connection is not opened for every query. The connection is locked while the cursor is in use. Changes made with the
+    cursor are committed when it is released, or rolled back if an exception is raised.
+
+    Yields (sqlite3.Cursor): cursor of the shared connection.
+    """
+    with connection_lock, connection:
+        cursor = connection.cursor()
+        try:
+            yield cursor
+        finally:
+            cursor.close()
+
+
+@contextmanager
+def reading_cursor() -> Iterator[Cursor]:
+    """
+    This function provides read access to the database through one of the connections that are only read through. As
+    the database is in WAL mode, reading through them is not blocked by the shared connection being locked or written
+    through, and several threads can read at once. Nothing must be written through the cursor.
+
+    Yields (sqlite3.Cursor): cursor of a free reading connection.
+    """
+    reading_connection = reading_connections.get()
+    cursor = reading_connection.cursor()
+    try:
+        yield cursor
+    finally:
+        cursor.close()
+        reading_connections.put(reading_connection)
+
+
+def read_all(query: str, parameters: tuple = ()) -> list[tuple]:
+    """
+    This function runs a single reading query through src.bot.auxiliary.reading_cursor.
+
+    Args:
+        query (str): SQL query that only reads.
+        parameters (tuple, optional): values of the query's placeholders.
+
+    Returns (list[tuple]): all records that the query has read.
+    """
+    with reading_cursor() as cursor:
+        cursor.execute(query, parameters)
+        return cursor.fetchall()
+
+
+def read_one(query: str, parameters: tuple = ()) -> Union[tuple, None]:
+    """
+    This function is the same as src.bot.auxiliary.read_all, except that it only returns the first record.
+
+    Returns (tuple or None): the first record that the query has read. None if nothing is read.
+    """
+    with reading_cursor() as cursor:
+        cursor.execute(query, parameters)
+        return cursor.fetchone()
 
 
 def get_chat_record(chat_id: int) -> Union[ChatRecord, None]:
@@ -25,43 +145,198 @@ def get_chat_record(chat_id: int) -> Union[ChatRecord, None]:
     Returns (src.bot.auxiliary.ChatRecord or None): record of the chat with the given id. None if the chat is not
         registered.
     """
-    connection = connect(DATABASE)
-    cursor = connection.cursor()
+    return get_chat_records(chat_id)[0]
 
-    cursor.execute(
-        'SELECT * FROM chats WHERE id = ?',
-        (chat_id,)
-    )
-    record = cursor.fetchone()
 
-    try:
-        record = ChatRecord(*record)
-    except TypeError:
-        record = None
+def get_chat_records(*chat_ids: int) -> list[Union[ChatRecord, None]]:
+    """
+    This function returns records of the chats, reading the ones that are not cached with a single query.
 
-    cursor.close()
-    connection.close()
+    Args:
+        chat_ids (int): ids of the chats that records will be returned of.
 
-    return record
+    Returns (list[src.bot.auxiliary.ChatRecord or None]): records of the chats with the given ids, in the same order.
+        None for the chats that are not registered.
+    """
+    # each record is looked up once, since it can be forgotten by another thread between a check and a lookup
+    records = [chat_records.get(chat_id) for chat_id in chat_ids]
+    if None not in records:  # if all are cached
+        return records
+
+    missing = list({chat_id for chat_id, record in zip(chat_ids, records) if record is None})
+    with database_cursor() as cursor:  # the lock is held until the records are cached, see forget_chat_record
+        cursor.execute(
+            f'SELECT * FROM chats WHERE id IN ({", ".join("?" * len(missing))})',
+            missing
+        )
+        for record in cursor.fetchall():
+            if len(chat_records) >= CACHED_CHAT_RECORDS:
+                del chat_records[next(iter(chat_records))]  # forgetting the oldest cached record
+            chat_records[record[0]] = to_chat_record(record)
+
+        return [chat_records.get(chat_id) for chat_id in chat_ids]
+
+
+def get_related_chat_records(group_id: int) -> list[ChatRecord]:
+    """
+    This function returns records of all chats related to the group. They are cached until one of them is changed (see
+    src.bot.auxiliary.forget_chat_record), so the group's students and group chats are looked up among them instead of
+    being read from the database by each interaction.
+
+    Args:
+        group_id (int): id of the group that related chats' records will be returned of.
 
+    Returns (list[src.bot.auxiliary.ChatRecord]): records of the chats, sorted by their usernames or other identifiers.
+        The list is shared, so it must not be changed.
+    """
+    if (records := related_chat_records.get(group_id)) is not None:  # if the records are cached
+        return records
+
+    with database_cursor() as cursor:  # the lock is held until the records are cached, see forget_chat_record
+        cursor.execute(
+            'SELECT * FROM chats WHERE group_id = ? ORDER BY username COLLATE ALPHABETICAL',
+            (group_id,)
+        )
+        records = related_chat_records[group_id] = [to_chat_record(record) for record in cursor.fetchall()]
+        return records
+
+
+def to_chat_record(record: tuple) -> ChatRecord:
+    """
+    Args:
+        record (tuple): record of a chat as it is read from the database.
+
+    Returns (src.bot.auxiliary.ChatRecord): the same record, with familiarity parsed.
+    """
+    return ChatRecord(*record[:6], Familiarity(int(record[6] or 0)), *record[7:])
+
+
+def forget_chat_record(chat_id: int):
+    """
+    This function removes the chat's record from the caches used by src.bot.auxiliary.get_chat_record and
+    src.bot.auxiliary.get_related_chat_records. It is called after the chat's record is changed in the database, so that
+    the next call reads the changed record. The lock of the connection is acquired, so that a record that is being read
+    before the change is not cached after it.
+
+    Args:
+        chat_id (int): id of the chat that record will be removed of.
+    """
+    with connection_lock:
+        chat_records.pop(chat_id, None)
+        for group_id in [
+            group_id for group_id, records in related_chat_records.items() if any(r.id == chat_id for r in records)
+        ]:
+            del related_chat_records[group_id]
 
+
+def forget_group_chat_records(group_id: int):
+    """
+    This function removes records of all chats related to the group from the caches used by
+    src.bot.auxiliary.get_chat_record and src.bot.auxiliary.get_related_chat_records. It is also called after a chat
+    related to the group is registered. See src.bot.auxiliary.forget_chat_record.__doc__.
+
+    Args:
+        group_id (int): id of the group that related chats' records will be removed of.
+    """
+    with connection_lock:
+        for chat_id in [chat_id for chat_id, record in chat_records.items() if record.group_id == group_id]:
+            del chat_records[chat_id]
+        related_chat_records.pop(group_id, None)
+
+
+def get_reference_data(*key) -> Any:
+    """
+    This function returns reference data (cities, EDUs, departments) that has been cached with
+    src.bot.auxiliary.cache_reference_data, so that it is not read from the database by every registering chat.
+
+    Args:
+        key: kind of the data (e.g. 'cities'), followed by what the data depends on (e.g. id of the EDU).
+
+    Returns (Any): the cached data. None if it has not been cached or has expired.
+    """
+    if (cached := reference_data.get(key)) and monotonic() < cached[0]:  # if the data is cached and has not expired
+        return cached[1]
+
+
+def cache_reference_data(data: Any, *key):
+    """
+    This function caches reference data for src.bot.config.REFERENCE_DATA_TTL seconds.
+
+    Args:
+        data (Any): the data, already in the form that it is used in (e.g. sorted).
+        key: see src.bot.auxiliary.get_reference_data.__doc__.
+    """
+    reference_data[key] = (monotonic() + REFERENCE_DATA_TTL, data)
+
+
+def read_group_data(column: str, group_id: int) -> Union[str, None]:
+    """
+    This function returns the group's events or info. As they are displayed much more often than changed, they are
+    cached for the number of seconds that src.bot.config.GROUP_DATA_TTLS defines for the column.
+
+    Args:
+        column (str): column of the groups table that is read, 'events' or 'info'.
+        group_id (int): id of the group that the data will be returned of.
+
+    Returns (str or None): the group's data as it is stored in the database. None if the group has none.
+    """
+    if (cached := group_data.get((column, group_id))) and monotonic() < cached[0]:  # if cached and has not expired
+        return cached[1]
+
+    with data_lock:  # held until the data is cached, so that data read before a change is not cached after it
+        data = read_one(f'SELECT {column} FROM groups WHERE id = ?', (group_id,))[0]
+        group_data[column, group_id] = (monotonic() + GROUP_DATA_TTLS[column], data)
+        return data
+
+
+def forget_group_data(column: str, group_id: int = None):
+    """
+    This function removes the group's data from the cache used by src.bot.auxiliary.read_group_data. It is to be called
+    after the data is changed.
+
+    Args:
+        column (str): see src.bot.auxiliary.read_group_data.__doc__.
+        group_id (int, optional): id of the group that the data will be removed of. If not given, the data of all
+            groups is removed.
+    """
+    with data_lock:
+        for key in [key for key in group_data if key[0] == column and group_id in (None, key[1])]:
+            del group_data[key]
+
+
+@lru_cache(CACHED_SORT_KEYS)
 def str_sort_key(string: str) -> int:
     """
     This function serves as a key for sorting strings in Ukrainian, English and Russian. It only considers alphabetical
     letters of these languages. It is needed because Unicode order is sometimes different from the alphabetical one.
+    The keys are cached, since the ALPHABETICAL collation computes 2 of them for each comparison of the same usernames.
 
     Args:
         string (str): element of the sorted sequence.
     """
-    letters = 'abcdefghijklmnopqrstuvwxyzабвгґдеєёжзиіїйклмнопрстуфхцчшщъыьэюя'
-
     for ch in string:
-        if (ch_l := ch.lower()) in letters:
-            return letters.index(ch_l)
+        if (index := LETTER_INDICES.get(ch)) is not None:
+            return index
 
     return 0
 
 
+def update_role(chat_id: int, role: int):
+    """
+    This function changes the role of the student in the database and forgets the student's cached record.
+
+    Args:
+        chat_id (int): id of the student's private chat.
+        role (int): the student's new role, see src.bot.config.ORDINARY_ROLE and the others.
+    """
+    with database_cursor() as cursor:
+        cursor.execute(
+            'UPDATE chats SET role = ? WHERE id = ?',
+            (role, chat_id)
+        )
+    forget_chat_record(chat_id)
+
+
 def update_group_chat_language(group_id: int):
     """
     This function sets language of the group's group chat to the most popular among its students.
@@ -69,48 +344,99 @@ def update_group_chat_language(group_id: int):
     Args:
         group_id (int): id of the group that group chat's language will be updated of.
     """
-    connection = connect(DATABASE)
-    cursor = connection.cursor()
-    cursor.execute(
-        'SELECT language, COUNT(language) AS spoken_by '
-        'FROM chats WHERE group_id = ? AND type = 0 '
-        'GROUP BY language '
-        'ORDER BY spoken_by DESC',
-        (group_id,)
-    )
-    common_language, spoken_by = cursor.fetchone()
-    cursor.execute(
-        'UPDATE chats SET language = ? '
-        'WHERE group_id = ? AND type <> 0',
-        (common_language, group_id,)
-    )
-    connection.commit()
-    cursor.close()
-    connection.close()
-    log.cl.info(log.GROUP_LANGUAGE_UPDATED.format(group_id, LANGUAGES[common_language], spoken_by))
-
-
-def str_to_datetime(event: str) -> datetime:
+    with database_cursor() as cursor:
+        cursor.execute(
+            'SELECT language, COUNT(language) AS spoken_by '
+            'FROM chats WHERE group_id = ? AND type = 0 '
+            'GROUP BY language '
+            'ORDER BY spoken_by DESC LIMIT 1',
+            (group_id,)
+        )
+        common_language, spoken_by = cursor.fetchone()
+        cursor.execute(
+            'UPDATE chats SET language = ? '
+            'WHERE group_id = ? AND type <> 0',
+            (common_language, group_id,)
+        )
+    forget_group_chat_records(group_id)
+    log.cl.info(log.GROUP_LANGUAGE_UPDATED, group_id, LANGUAGES[common_language], spoken_by)
+
+
+class EventDates:
+    """
+    This class represents dates of a group's events as a sequence (for bisect) that converts an event to
+    datetime.datetime only when its date is accessed, so that a search among many events converts few of them.
+    """
+
+    def __init__(self, events: list[str]):
+        """
+        Args:
+            events (list[str]): the group's events, sorted by their dates.
+        """
+        self.events = events
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def __getitem__(self, index: int) -> datetime:
+        return str_to_datetime(self.events[index])
+
+
+class RateLimiter:
+    """
+    This class spaces out actions of all threads that use it, so that no more than the given number of them are taken in
+    a second. Up to that number of actions can be taken at once if none have been taken for a second (a token bucket).
+    """
+
+    def __init__(self, rate: int):
+        """
+        Args:
+            rate (int): how many actions can be taken in a second.
+        """
+        self.rate = rate
+        self.tokens = float(rate)  # actions that can be taken right away, negative if some are already waiting
+        self.updated = monotonic()
+        self.lock = Lock()
+
+    def wait(self):
+        """
+        This method blocks the calling thread until its action can be taken.
+        """
+        with self.lock:  # the action's turn is reserved under the lock, the waiting is done without it
+            now = monotonic()
+            self.tokens = min(self.rate, self.tokens + (now - self.updated) * self.rate) - 1
+            self.updated = now
+            delay = -self.tokens / self.rate
+
+        if delay > 0:  # if the action has to wait for its turn
+            sleep(delay)
+
+
+def str_to_datetime(event: str, now: datetime = None) -> datetime:
     """
     Args:
         event (str): string that begins with date in one of the two formats that date is stored in the database in:
             '%u %d.%m' or '%u %d.%m, %H:%M' (actually, (%u - 1) instead of %u, Monday to Sunday = 0 to 6).
+        now (datetime.datetime, optional): current moment, given when many dates are converted at once, so that the
+            clock is not read for each of them. If not given, the clock is read.
 
     Returns (datetime.datetime): datetime.datetime of the date that the given string begins with.
     """
-    weekday_index, day, month, hour, minute = int(event[0]), int(event[2:4]), int(event[5:7]), 23, 59
+    # the digits are at fixed positions and are converted by their codes, which avoids slicing and parsing with int()
+    weekday_index, hour, minute = ord(event[0]) - ZERO, 23, 59
+    day, month = ord(event[2]) * 10 + ord(event[3]) - ZERO_11, ord(event[5]) * 10 + ord(event[6]) - ZERO_11
     if event[7] == ',':  # if the event contains time
-        hour, minute = int(event[9:11]), int(event[12:14])
+        hour, minute = ord(event[9]) * 10 + ord(event[10]) - ZERO_11, ord(event[12]) * 10 + ord(event[13]) - ZERO_11
 
-    now = datetime.now()
-    date_this_year = datetime(now.year, month, day, hour, minute)
-    weekday_index_this_year = int(date_this_year.strftime('%u')) - 1
+    year = (now or datetime.now()).year
+    date_this_year = datetime(year, month, day, hour, minute)
+    weekday_index_this_year = date_this_year.weekday()
 
     if weekday_index > weekday_index_this_year or (weekday_index == 0 and weekday_index_this_year == 6):
-        return datetime(now.year + 1, month, day, hour, minute)
+        return datetime(year + 1, month, day, hour, minute)
 
     if weekday_index < weekday_index_this_year or (weekday_index == 6 and weekday_index_this_year == 0):
-        return datetime(now.year - 1, month, day, hour, minute)
+        return datetime(year - 1, month, day, hour, minute)
 
     return date_this_year
 
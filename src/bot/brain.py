@@ -1,15 +1,11 @@
-from time import sleep
-from datetime import datetime, timedelta
-
 from telegram import Update, Chat
 
 from interactions import Registration, current
-from managers import COMMANDS
+from managers import COMMANDS, command_of
 from notifications import remind_about_events, check_ecampus_updates
-from auxiliary import get_chat_record
+from auxiliary import get_chat_record, get_chat_records
 from text import REGISTRATION_NEEDED
-from bot_info import USERNAME
-from config import LEADER_ROLE, NOTIFICATION_TIME
+from config import LEADER_ROLE
 from log import cl, UNAVAILABLE_COMMAND
 
 
@@ -26,17 +22,21 @@ def command_handler(update: Update, _):
         _ (telegram.CallbackContext): context object passed by the CommandHandler. Not used.
     """
     chat = update.effective_chat
+    chat_type = chat.type  # read once, as it is compared twice
 
-    if chat.type == Chat.CHANNEL:  # if the chat is a channel
+    if chat_type == Chat.CHANNEL:  # if the chat is a channel
         return  # no response
 
     message = update.effective_message
-    command_str = message.text[1:].removesuffix(USERNAME).lower()  # without '/' and possible bot mention
-    is_private = chat.type == Chat.PRIVATE
+    command_str = command_of(message.text)
+    is_private = chat_type == Chat.PRIVATE
 
     if command_str != Registration.COMMAND:  # if the command does not start the registration
 
-        if record := get_chat_record(update.effective_user.id):  # if the user is registered
+        # records of the user and the chat, the latter is needed if the user is not registered
+        record, group_chat_record = get_chat_records(update.effective_user.id, chat.id)
+
+        if record:  # if the user is registered
             try:
                 command = COMMANDS[command_str]
             except KeyError:  # if the message contains text other than the command
@@ -48,10 +48,10 @@ def command_handler(update: Update, _):
             else:  # if the command is a leader one and the user is not a leader
                 text = command.interaction.UNAVAILABLE_MESSAGE[record.language]
                 message.reply_text(text, quote=not is_private)
-                cl.info(UNAVAILABLE_COMMAND.format(record.id, command_str, record.role))
+                cl.info(UNAVAILABLE_COMMAND, record.id, command_str, record.role)
 
         # if the user is not registered but the group chat is
-        elif group_chat_record := get_chat_record(update.effective_chat.id):
+        elif group_chat_record:
             message.reply_text(REGISTRATION_NEEDED[group_chat_record.language], quote=not is_private)
 
     else:  # if the command starts the registration
@@ -69,13 +69,12 @@ def callback_query_handler(update: Update, _):
         _ (telegram.CallbackContext): context object passed by the CallbackQueryHandler. Not used.
     """
     chat_id = update.effective_chat.id
-    try:
-        current[chat_id].next_action(update)
-    except KeyError:
-        try:
-            current[get_chat_record(chat_id).group_id].next_action(update)
-        except KeyError:
-            pass
+    if not (interaction := current.get(chat_id)):  # if the chat is not having an interaction
+        record = get_chat_record(chat_id)
+        interaction = current.get(record.group_id) if record else None  # the group's interaction
+
+    if interaction:
+        interaction.next_action(update)
 
 
 def text_handler(update: Update, _):
@@ -87,8 +86,8 @@ def text_handler(update: Update, _):
         update (telegram.Update): update received after the text message is received.
         _ (telegram.CallbackContext): context object passed by the MessageHandler. Not used.
     """
-    if (chat_id := update.effective_chat.id) in current:
-        current[chat_id].next_action(update)
+    if interaction := current.get(update.effective_chat.id):  # if the chat is having an interaction
+        interaction.next_action(update)
 
 
 def poll_answer_handler(update: Update, _):
@@ -106,20 +105,14 @@ def poll_answer_handler(update: Update, _):
 
 # --------------------------------------------------------------------------------------------------------- notification
 
-def notification():
-    now = datetime.now()
-    notification_time_today = datetime(now.year, now.month, now.day, *NOTIFICATION_TIME)
-
-    try:
-        sleep((notification_time_today - now).total_seconds())
-    except ValueError:
-        notification_time_tomorrow = notification_time_today + timedelta(days=1)
-        sleep((notification_time_tomorrow - now).total_seconds())
-
-    while True:
-        remind_about_events()
-        check_ecampus_updates()
+def notification(_):
+    """
+    This function is the callback for the daily job of src.bot.launch.updater.job_queue. It is called at
+    src.bot.config.NOTIFICATION_TIME and makes the bot remind students about events and notify them about changes in
+    E-Campus.
 
-        now = datetime.now()
-        notification_time_tomorrow = datetime(now.year, now.month, now.day, *NOTIFICATION_TIME) + timedelta(days=1)
-        sleep((notification_time_tomorrow - now).total_seconds())
+    Args:
+        _ (telegram.CallbackContext): context object passed by the job. Not used.
+    """
+    remind_about_events()
+    check_ecampus_updates()
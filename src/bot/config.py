@@ -6,16 +6,29 @@ LANGUAGES = ('українська', 'English', 'русский')
 CHAT_TYPES = (Chat.PRIVATE, Chat.GROUP, Chat.SUPERGROUP)
 ORDINARY_ROLE, ADMIN_ROLE, LEADER_ROLE = 0, 1, 2
 
-DATABASE = '../../memory.db'
-INITIAL_ROLE, INITIAL_FAMILIARITY = ORDINARY_ROLE, '000000000000000'
+DATABASE, CACHED_STATEMENTS = '../../memory.db', 128  # enough for every query of the bot to stay prepared
+CACHED_CHAT_RECORDS = 4096  # records of chats that have been the most recently read
+CACHED_SORT_KEYS = 4096  # sort keys of usernames and names that have been the most recently compared
+REFERENCE_DATA_TTL = 24 * 60 * 60  # seconds that cities, EDUs and departments stay cached, they are changed manually
+GROUP_DATA_TTLS = {'events': 10, 'info': 60}  # seconds that groups' displayed data is cached, unless changed earlier
+# readers do not block the writer, commits are not synced until checkpoints, reads are served from memory when possible
+DATABASE_PRAGMAS = ('journal_mode = WAL', 'synchronous = NORMAL', 'mmap_size = 268435456', 'cache_size = -20000',
+                    'temp_store = MEMORY')
+READING_CONNECTIONS = 3  # the communication and notification threads and a sending one can read at once
+INITIAL_ROLE, INITIAL_FAMILIARITY = ORDINARY_ROLE, 0
 KPI_ID = 100
+KPI_GROUP_IDS = range(KPI_ID * 10 ** 5, (KPI_ID + 1) * 10 ** 5)  # a group's id begins with its EDU's id
 
+MONTH_LENGTHS = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)  # February has 29 days in leap years
 THRESHOLD_DATE = (8, 31)  # August 31, the last day before the next EDU year starts
 NOTIFICATION_TIME = (7, 30)  # 07:30 AM, when notifications are sent
+TIMEZONE = 'Europe/Kiev'  # where the time above is local, the name is known to older zone databases too
 ECAMPUS_URL, ECAMPUS_THREADS, ECAMPUS_WAIT = 'https://ecampus.kpi.ua/login', 5, 10
+SENDING_THREADS, BOT_CONNECTIONS = 8, 16  # the bot's connections are used by sending threads and the updater's workers
+MESSAGES_PER_SECOND = 30  # Telegram's limit on how many messages a bot can send to different chats in a second
 
 EDU_YEAR_PATTERN = compile(r'(\d)+.+?(\d)+')
-DATE_PATTERN = compile(r'(\d{1,2})\.(\d{1,2})(,? (\d{1,2}):(\d{1,2}))?')
+DATE_PATTERN = compile(r'(\d{1,2})\.(\d{1,2})(?:,? (\d{1,2}):(\d{1,2}))?')
 
 MAX_GROUP_NAME_LENGTH = 15
 MIN_GROUPMATES_FOR_LC, MAX_EDU_YEARS = 1, 6
@@ -1,13 +1,14 @@
 from datetime import datetime
+from calendar import isleap
 from random import choice
 from typing import Callable, Union
 from collections import OrderedDict
-from re import findall
-from sqlite3 import connect
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ThreadPoolExecutor, Future
 
-from telegram.ext import Updater
-from telegram import Update, Chat, Message, InlineKeyboardButton, InlineKeyboardMarkup, CallbackQuery, ParseMode
+from telegram import Bot, Update, Chat, Message, InlineKeyboardButton, InlineKeyboardMarkup, CallbackQuery, ParseMode
 from telegram.error import BadRequest
+from telegram.utils.request import Request
 
 import auxiliary as a
 import text as t
@@ -15,8 +16,36 @@ from bot_info import TOKEN
 import config as c
 import log
 
-updater = Updater(TOKEN)
-bot = updater.bot
+# only the client is created on import, the updater with its threads is created by src.bot.launch
+bot = Bot(TOKEN, request=Request(con_pool_size=c.BOT_CONNECTIONS))
+sending_pool = ThreadPoolExecutor(c.SENDING_THREADS)  # for sending messages to many chats without waiting for each one
+sending_limiter = a.RateLimiter(c.MESSAGES_PER_SECOND)  # shared by everything that sends messages to many chats
+
+# keyboards that do not depend on the chat, so they are built once
+language_markup = InlineKeyboardMarkup([[
+    InlineKeyboardButton(language, callback_data=str(index)) for index, language in enumerate(c.LANGUAGES)
+]])
+polar_markups = tuple(  # in each language
+    InlineKeyboardMarkup([[InlineKeyboardButton(yes, callback_data='y'), InlineKeyboardButton(no, callback_data='n')]])
+    for yes, no in zip(t.YES, t.NO)
+)
+refuse_markups = tuple(  # in each language
+    InlineKeyboardMarkup([[InlineKeyboardButton(refuse, callback_data='refuse')]]) for refuse in t.REFUSE_TO_ANSWER
+)
+stop_asking_markups = tuple(  # in each language
+    InlineKeyboardMarkup([[InlineKeyboardButton(stop, callback_data='terminate')]]) for stop in t.STOP_ASKING_GROUP
+)
+
+
+def send_limited(chat_id: int, *args, **kwargs) -> Message:
+    """
+    This function makes the bot send a message to the chat as soon as src.bot.interactions.sending_limiter allows it. It
+    is used for sending to many chats at once, so that Telegram does not reject messages for exceeding its limit.
+
+    Returns (telegram.Message): the sent message.
+    """
+    sending_limiter.wait()
+    return bot.send_message(chat_id, *args, **kwargs)
 
 
 class Interaction:
@@ -29,6 +58,8 @@ class Interaction:
         IS_PRIVATE (bool): whether this interaction can only be in a private chat.
         ONGOING_MESSAGE (tuple[str]): message in case of an attempt to start a different interaction.
         ALREADY_MESSAGE (tuple[str]): message in case of using self.COMMAND during the interaction.
+        FAMILIARITY (src.bot.auxiliary.Familiarity): flag of the interaction in users' familiarity. Only defined for
+            interactions that are started by registered users.
         chat_id (int): id of the chat that the interaction is in.
         language (int): index of interaction's language, according to src.bot.config.LANGUAGES.
         next_action (Callable[[Update], None]): method that makes the bot take the next step of the interaction.
@@ -37,11 +68,15 @@ class Interaction:
     IS_PRIVATE: bool
     ONGOING_MESSAGE: tuple[str]
     ALREADY_MESSAGE: tuple[str]
+    FAMILIARITY: a.Familiarity
 
     chat_id: int
     language: int
     next_action: Callable[[Update], None]
 
+    # attributes of instances, which have no __dict__ as they are many, each subclass declares its own ones
+    __slots__ = ('chat_id', 'language', 'group_id', 'is_familiar', 'familiarity', 'next_action')
+
     def __init__(self, record: a.ChatRecord = None):
         """
         This method is called when an interaction is started. It adds the interaction to src.bot.interactions.current
@@ -57,12 +92,11 @@ class Interaction:
         if record:
             self.chat_id, self.language, self.group_id = record.id, record.language, record.group_id
 
-            familiarity = a.Familiarity(*record.familiarity)
-            self.is_familiar = bool(int(getattr(familiarity, self.COMMAND)))
-            self.familiarity = None if self.is_familiar else familiarity
+            self.is_familiar = self.FAMILIARITY in record.familiarity  # the flag is looked up once, by the class
+            self.familiarity = None if self.is_familiar else record.familiarity
 
         current[self.chat_id] = self
-        log.cl.info(log.STARTS.format(self.chat_id, type(self).__name__))
+        log.cl.info(log.STARTS, self.chat_id, type(self).__name__)
 
     def send_message(self, *args, **kwargs) -> Message:
         """
@@ -81,11 +115,7 @@ class Interaction:
             query (telegram.CallbackQuery, optional): If given, the question will be asked by editing the query's
                 message.
         """
-        answers = [[
-            InlineKeyboardButton(t.YES[self.language], callback_data='y'),
-            InlineKeyboardButton(t.NO[self.language], callback_data='n')
-        ]]
-        markup = InlineKeyboardMarkup(answers)
+        markup = polar_markups[self.language]
 
         if not query:
             return self.send_message(question, reply_markup=markup)
@@ -108,40 +138,38 @@ class Interaction:
         """
         text = (self.ALREADY_MESSAGE if command == self.COMMAND else self.ONGOING_MESSAGE)[self.language]
         message.reply_text(text, quote=message.chat.type != Chat.PRIVATE)
-        log.cl.info(log.INTERRUPTS.format(message.from_user.id, command, type(self).__name__))
+        log.cl.info(log.INTERRUPTS, message.from_user.id, command, type(self).__name__)
 
     @staticmethod
-    def update_familiarity(user_id: int, familiarity: a.Familiarity, **kwargs):
+    def update_familiarity(user_id: int, interaction: a.Familiarity):
         """
-        This method updates the user's familiarity with the bot's interactions.
+        This method updates the user's familiarity with the bot's interactions. The interaction's flag is set by the
+        database itself, so the user's current familiarity is not needed and cannot be overwritten with a stale one.
 
         Args:
             user_id (int): id of the user that familiarity will be updated of.
-            familiarity (src.bot.auxiliary.Familiarity): the user's current familiarity.
-            kwargs: new values that familiarity fields will be set to.
-        """
-        connection = connect(c.DATABASE)
-        cursor = connection.cursor()
-        cursor.execute(  # updating the user's familiarity
-            'UPDATE chats SET familiarity = ? WHERE id = ?',
-            (''.join(familiarity._replace(**kwargs)), user_id)
-        )
-        connection.commit()
-        cursor.close()
-        connection.close()
-        log.cl.info(log.BECOMES_FAMILIAR.format(user_id, tuple(kwargs.keys())[0]))
+            interaction (src.bot.auxiliary.Familiarity): flag of the interaction that the user becomes familiar with.
+        """
+        with a.database_cursor() as cursor:
+            cursor.execute(  # updating the user's familiarity
+                'UPDATE chats SET familiarity = familiarity | ? WHERE id = ?',
+                (interaction, user_id)
+            )
+        a.forget_chat_record(user_id)
+        log.cl.info(log.BECOMES_FAMILIAR, user_id, interaction.name)
 
     def terminate(self):
         """
         This method terminates the interaction by deleting the instance in src.bot.interactions.current.
         """
         del current[self.chat_id]
-        log.cl.info(log.ENDS.format(self.chat_id, type(self).__name__))
+        log.cl.info(log.ENDS, self.chat_id, type(self).__name__)
 
 
 class Registration(Interaction):
     COMMAND, IS_PRIVATE = 'start', False
     ONGOING_MESSAGE, ALREADY_MESSAGE = t.ONGOING_REGISTRATION, t.ALREADY_REGISTRATION
+    __slots__ = ('is_student', 'is_first', 'username')
 
     def __init__(self, chat_id: int, chat_type: str):
         self.chat_id, self.language = chat_id, None
@@ -157,12 +185,7 @@ class Registration(Interaction):
         """
         This method makes the bot ask the chat their language. The options are provided as inline buttons.
         """
-        languages = [[
-            InlineKeyboardButton(language, callback_data=str(index)) for index, language in enumerate(c.LANGUAGES)
-        ]]
-        markup = InlineKeyboardMarkup(languages)
-
-        self.send_message(t.ASK_LANGUAGE, reply_markup=markup)
+        self.send_message(t.ASK_LANGUAGE, reply_markup=language_markup)
 
     def ask_city(self, update: Update):
         """
@@ -192,16 +215,12 @@ class Registration(Interaction):
         """
         Returns (list[str]): sorted list of all cities in the database.
         """
-        connection = connect(c.DATABASE)
-        cursor = connection.cursor()
+        if (cities := a.get_reference_data('cities')) is not None:  # if the cities are cached
+            return cities
 
-        cursor.execute('SELECT DISTINCT city FROM EDUs')
-        cities: list[str] = [city[0] for city in cursor.fetchall()]
+        cities = [city[0] for city in a.read_all('SELECT DISTINCT city FROM EDUs ORDER BY city COLLATE ALPHABETICAL')]
 
-        cursor.close()
-        connection.close()
-
-        cities.sort(key=a.str_sort_key)
+        a.cache_reference_data(cities, 'cities')
         return cities
 
     def ask_edu(self, update: Update):
@@ -234,19 +253,15 @@ class Registration(Interaction):
         Returns (list[tuple[int, str]]): EDUs in the given city, sorted by their name. Namely, list of tuples that
             contain the EDUs id and full name.
         """
-        connection = connect(c.DATABASE)
-        cursor = connection.cursor()
+        if (edus := a.get_reference_data('EDUs', city)) is not None:  # if the city's EDUs are cached
+            return edus
 
-        cursor.execute(  # records of EDUs in the chosen city
-            'SELECT id, name FROM EDUs WHERE city = ?',
+        edus: list[tuple[int, str]] = a.read_all(  # records of EDUs in the chosen city
+            'SELECT id, name FROM EDUs WHERE city = ? ORDER BY name COLLATE ALPHABETICAL',
             (city,)
         )
-        edus: list[tuple[int, str]] = cursor.fetchall()
-
-        cursor.close()
-        connection.close()
 
-        edus.sort(key=lambda e: a.str_sort_key(e[1]))
+        a.cache_reference_data(edus, 'EDUs', city)
         return edus
 
     def ask_department(self, update: Update):
@@ -266,12 +281,14 @@ class Registration(Interaction):
         except AttributeError:  # if the update is not caused by choosing the EDU
             return  # no response
 
-        departments = self.get_departments()
-        departments = [
-            [InlineKeyboardButton(name, callback_data=str(department_id)) for department_id, name in row]
-            for row in [departments[i:i + 4] for i in range(0, len(departments), 4)]
-        ]
-        markup = InlineKeyboardMarkup(departments)
+        # the keyboard is cached with the departments, as it does not depend on the chat
+        if (markup := a.get_reference_data('departments', self.group_id, 'markup')) is None:
+            departments = self.get_departments()
+            markup = InlineKeyboardMarkup([  # 4 departments in a row
+                [InlineKeyboardButton(name, callback_data=str(d_id)) for d_id, name in departments[i:i + 4]]
+                for i in range(0, len(departments), 4)
+            ])
+            a.cache_reference_data(markup, 'departments', self.group_id, 'markup')
 
         query.message.edit_text(t.ASK_DEPARTMENT[self.language], reply_markup=markup)
         self.next_action = self.ask_group_name
@@ -281,19 +298,17 @@ class Registration(Interaction):
         Returns (tuple[tuple[int, str]]): departments of the chosen EDU, sorted by their names. Namely, list of tuples
             that contain the department's id and name.
         """
-        connection = connect(c.DATABASE)
-        cursor = connection.cursor()
+        if (departments := a.get_reference_data('departments', self.group_id)) is not None:  # if they are cached
+            return departments
 
-        cursor.execute(  # departments of the chosen EDU
+        departments_str: str = a.read_one(  # departments of the chosen EDU, they are stored sorted in the database
             'SELECT departments FROM EDUs WHERE id = ?',
             (self.group_id,)
-        )
-        departments: str = cursor.fetchone()[0]  # departments are stored sorted in the database
+        )[0]
 
-        cursor.close()
-        connection.close()
-
-        return tuple(enumerate(departments.split()))
+        departments = tuple(enumerate(departments_str.split()))
+        a.cache_reference_data(departments, 'departments', self.group_id)
+        return departments
 
     def ask_group_name(self, update: Update):
         """
@@ -355,16 +370,16 @@ class Registration(Interaction):
         Args:
             group_name (str): the given group name, converted to uppercase.
         """
-        department_group_records = self.get_department_group_records()
+        # ids of groups from the department by their names
+        department_groups = {name: group_id for group_id, name in self.get_department_group_records()}
 
-        if department_group_records:  # if the chat is not the first one from the department to be registered
+        if department_groups:  # if the chat is not the first one from the department to be registered
 
-            for group_id, name in department_group_records:
-                if name == group_name:  # if the chat is not the first one from the group to be registered
-                    self.group_id = group_id  # taking id of the group
-                    break
+            # if the chat is not the first one from the group to be registered
+            if (group_id := department_groups.get(group_name)) is not None:
+                self.group_id = group_id  # taking id of the group
             else:  # if the chat is the first one from the group to be registered
-                self.group_id = group_id + 1
+                self.group_id = max(department_groups.values()) + 1
                 self.is_first = True
 
         else:  # if the chat is the first one from the department to be registered
@@ -377,19 +392,10 @@ class Registration(Interaction):
         Returns (list[tuple[int, str]]): records of groups from the chat's department. Namely, list of tuples that
             contain the group's id and name.
         """
-        connection = connect(c.DATABASE)
-        cursor = connection.cursor()
-
-        cursor.execute(  # groups of the chosen department of the chosen EDU
-            'SELECT id, name FROM groups WHERE id / 1000 = ?',
-            (self.group_id,)
+        return a.read_all(  # groups of the chosen department of the chosen EDU, a range of ids is searched by the key
+            'SELECT id, name FROM groups WHERE id BETWEEN ? AND ?',
+            (self.group_id * 1000, self.group_id * 1000 + 999)
         )
-        department_group_records: list[tuple[int, str]] = cursor.fetchall()
-
-        cursor.close()
-        connection.close()
-
-        return department_group_records
 
     def create_record(self, update: Update, registered_at: str, group_name: str):
         """
@@ -411,34 +417,30 @@ class Registration(Interaction):
         chat = update.effective_chat
         type_index = c.CHAT_TYPES.index(chat.type)
 
-        connection = connect(c.DATABASE)
-        cursor = connection.cursor()
-
-        if self.is_student:
-            self.username = update.effective_user.name  # username / full name / first name
-            cursor.execute(  # creating a user record
-                'INSERT INTO chats (id, type, username, language, group_id, role, familiarity, registered)'
-                'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
-                (self.chat_id, type_index, self.username, self.language, self.group_id, c.INITIAL_ROLE,
-                 c.INITIAL_FAMILIARITY, registered_at)
-            )
-        else:
-            self.username = chat.username or chat.title  # username / title
-            cursor.execute(  # creating a group-chat record
-                'INSERT INTO chats (id, type, username, language, group_id, registered) VALUES (?, ?, ?, ?, ?, ?)',
-                (self.chat_id, type_index, self.username, self.language, self.group_id, registered_at)
-            )
+        with a.database_cursor() as cursor:
+            if self.is_student:
+                self.username = update.effective_user.name  # username / full name / first name
+                cursor.execute(  # creating a user record
+                    'INSERT INTO chats (id, type, username, language, group_id, role, familiarity, registered)'
+                    'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                    (self.chat_id, type_index, self.username, self.language, self.group_id, c.INITIAL_ROLE,
+                     c.INITIAL_FAMILIARITY, registered_at)
+                )
+            else:
+                self.username = chat.username or chat.title  # username / title
+                cursor.execute(  # creating a group-chat record
+                    'INSERT INTO chats (id, type, username, language, group_id, registered) VALUES (?, ?, ?, ?, ?, ?)',
+                    (self.chat_id, type_index, self.username, self.language, self.group_id, registered_at)
+                )
 
-        if self.is_first:  # if the chat is the first one from the group to be registered
-            cursor.execute(  # creating a group record
-                'INSERT INTO groups (id, name) VALUES(?, ?)',
-                (self.group_id, group_name)
-            )
+            if self.is_first:  # if the chat is the first one from the group to be registered
+                cursor.execute(  # creating a group record
+                    'INSERT INTO groups (id, name) VALUES (?, ?)',
+                    (self.group_id, group_name)
+                )
+        a.forget_group_chat_records(self.group_id)  # the group's cached chats do not include the new one
 
-        connection.commit()
-        cursor.close()
-        connection.close()
-        log.cl.info(log.REGISTERS.format(self.chat_id, self.group_id))
+        log.cl.info(log.REGISTERS, self.chat_id, self.group_id)
 
     def report_on_related_chats(self, given_group_name: str):
         """
@@ -459,26 +461,17 @@ class Registration(Interaction):
             self.send_message(text)
             return
 
-        connection = connect(c.DATABASE)
-        cursor = connection.cursor()
-
         if self.is_student:  # if the new chat is a student
-            cursor.execute(  # the new student's groupmates
-                'SELECT id, language FROM chats '
-                'WHERE group_id = ? AND type = 0 AND id <> ?',
-                (self.group_id, self.chat_id)
-            )
-            groupmate_records: list[tuple[int, int]] = cursor.fetchall()
+            related_records = a.get_related_chat_records(self.group_id)  # groupmates and group chats of the group
 
-            cursor.execute(  # group chats of the student's group
-                'SELECT id FROM chats '
-                'WHERE group_id = ? AND type <> 0',
-                (self.group_id,)
-            )
-            group_chat_records: list[tuple[int]] = cursor.fetchall()
+            groupmate_records = [(r.id, r.language) for r in related_records if r.type == 0 and r.id != self.chat_id]
+            group_chat_records = [(r.id,) for r in related_records if r.type != 0]
 
-            for r in group_chat_records:
-                bot.send_message(r[0], choice(t.NEW_GROUPMATE[self.language]).format(self.username))
+            new_groupmate_texts = t.NEW_GROUPMATE[self.language]  # one is chosen for each group chat
+            sendings = [  # the messages are sent in parallel
+                sending_pool.submit(send_limited, r[0], choice(new_groupmate_texts).format(self.username))
+                for r in group_chat_records
+            ]
 
             num_groupmates, num_group_chats = len(groupmate_records), len(group_chat_records)
             text_leader, lc_available_msg = t.report_on_related_chats(num_groupmates, num_group_chats, self.language)
@@ -486,22 +479,17 @@ class Registration(Interaction):
             if lc_available_msg:
                 for user_id, language in groupmate_records:
                     text = t.LC_NOW_AVAILABLE[language].format(c.MIN_GROUPMATES_FOR_LC + 1, lc_available_msg[language])
-                    bot.send_message(user_id, text)
+                    sendings.append(sending_pool.submit(send_limited, user_id, text))
 
         else:  # if the new chat is a chat of a group
-            cursor.execute(  # the group's students
-                'SELECT username FROM chats '
-                'WHERE group_id = ? AND type = 0',
-                (self.group_id,)
-            )
-            student_usernames: list[str] = [r[0] for r in cursor.fetchall()]
-
+            student_usernames = [r.username for r in a.get_related_chat_records(self.group_id) if r.type == 0]
             text_leader = t.STUDENTS_FOUND[self.language].format('\n'.join(student_usernames))
+            sendings = []
 
         self.send_message(text_leader)
 
-        cursor.close()
-        connection.close()
+        for sending in sendings:
+            sending.result()  # waiting for the messages to be sent, an exception raised while sending is raised here
 
     def respond(self, command: str, message: Message):
         if self.language:  # if the chat has provided their language
@@ -511,11 +499,13 @@ class Registration(Interaction):
 class LeaderConfirmation(Interaction):
     COMMAND, IS_PRIVATE = 'claim', False
     ONGOING_MESSAGE, ALREADY_MESSAGE = t.ONGOING_ENTERING_YEARS, t.ALREADY_LC
+    __slots__ = ('username', 'group_chat', 'poll_message_id', 'num_votes', 'num_positive_votes', 'late_claimers',
+                 'is_cheating_reported')
 
     def __init__(self, record: a.ChatRecord, group_chat_record: tuple[int, int]):
         self.chat_id, self.language, self.group_id = record.id, record.language, record.group_id
         current[self.group_id] = self
-        log.cl.info(log.STARTS.format(self.chat_id, type(self).__name__))
+        log.cl.info(log.STARTS, self.chat_id, type(self).__name__)
 
         self.username = record.username
         self.group_chat = group_chat_record
@@ -523,6 +513,7 @@ class LeaderConfirmation(Interaction):
         self.poll_message_id: int = None
         self.num_votes, self.num_positive_votes = 0, 0
         self.late_claimers: list[tuple[int, int]] = []
+        self.is_cheating_reported = False  # whether the group chat has been told that the candidate votes
 
         self.send_confirmation_poll()
         self.next_action = self.handle_answer
@@ -542,8 +533,9 @@ class LeaderConfirmation(Interaction):
         """
         This method is called when the bot receives an update after the leader confirmation poll is sent. If the update
         is not caused by giving a poll answer, it is ignored. Otherwise, the given answer is counted unless it is given
-        by the candidate. If the number of votes reaches src.bot.config.MIN_GROUPMATES_FOR_LEADER_CONFORMATION, the poll
-        is deleted (closed) and it is checked whether the candidate is confirmed to be the group's leader.
+        by the candidate, which the group chat is told about once. If the number of votes reaches
+        src.bot.config.MIN_GROUPMATES_FOR_LEADER_CONFORMATION, the poll is deleted (closed) and it is checked whether
+        the candidate is confirmed to be the group's leader.
 
         Args:
             update (telegram.Update): update received after the leader confirmation poll is sent.
@@ -584,8 +576,9 @@ class LeaderConfirmation(Interaction):
                     text = t.LEADER_NOT_CONFIRMED[self.group_chat[1]].format(self.username)
                     bot.send_message(self.group_chat[0], text)
 
-        else:  # if the answer is given by the candidate
+        elif not self.is_cheating_reported:  # if the answer is given by the candidate for the first time
             bot.send_message(self.group_chat[0], t.CHEATING_IN_LC[self.language].format(self.username))
+            self.is_cheating_reported = True
 
     def handle_result(self) -> bool:
         """
@@ -595,21 +588,18 @@ class LeaderConfirmation(Interaction):
         Returns (bool): whether the candidate is confirmed to be the leader.
         """
         if self.num_positive_votes / c.MIN_GROUPMATES_FOR_LC > .5:
-            connection = connect(c.DATABASE)
-            cursor = connection.cursor()
-            cursor.execute(  # making the candidate the group's leader
-                'UPDATE chats SET role = 2 WHERE id = ?',
-                (self.chat_id,)
-            )
-            connection.commit()
-            cursor.close()
-            connection.close()
-            log.cl.info(log.CONFIRMED.format(self.chat_id))
+            with a.database_cursor() as cursor:
+                cursor.execute(  # making the candidate the group's leader
+                    'UPDATE chats SET role = 2 WHERE id = ?',
+                    (self.chat_id,)
+                )
+            a.forget_chat_record(self.chat_id)
+            log.cl.info(log.CONFIRMED, self.chat_id)
 
             return True
 
         else:
-            log.cl.info(log.NOT_CONFIRMED.format(self.chat_id))
+            log.cl.info(log.NOT_CONFIRMED, self.chat_id)
 
             for user_id, language in self.late_claimers:
                 bot.send_message(user_id, t.CANDIDATE_NOT_CONFIRMED[language].format(self.username))
@@ -672,24 +662,21 @@ class LeaderConfirmation(Interaction):
         Returns (tuple[int, int] or str): current year and how many years the group is going to study in total, if the
             information is valid. Otherwise, text describing why the given information is invalid.
         """
-        edu_years = findall(c.EDU_YEAR_PATTERN, edu_year)
+        if not (edu_years := c.EDU_YEAR_PATTERN.search(edu_year)):  # if no years are given
+            return t.INVALID_EDU_YEAR[self.language]
 
-        if (num_edu_years := len(edu_years)) == 1:  # if 1 EDU year is given
-            current_edu_year, all_edu_years = int(edu_years[0][0]), int(edu_years[0][1])
+        if c.EDU_YEAR_PATTERN.search(edu_year, edu_years.end()):  # if multiple years are given
+            return t.MULTIPLE_EDU_YEARS[self.language]
 
-            if current_edu_year <= all_edu_years:
-                if all_edu_years > c.MAX_EDU_YEARS:
-                    return t.INVALID_ALL_EDU_YEARS[self.language]
-            else:
-                return t.INVALID_CURRENT_EDU_YEAR[self.language]
+        current_edu_year, all_edu_years = int(edu_years[1]), int(edu_years[2])
 
-            return current_edu_year, all_edu_years
+        if current_edu_year > all_edu_years:
+            return t.INVALID_CURRENT_EDU_YEAR[self.language]
 
-        elif not num_edu_years:  # if no years are given
-            return t.INVALID_EDU_YEAR[self.language]
+        if all_edu_years > c.MAX_EDU_YEARS:
+            return t.INVALID_ALL_EDU_YEARS[self.language]
 
-        else:  # if multiple years are given
-            return t.MULTIPLE_EDU_YEARS[self.language]
+        return current_edu_year, all_edu_years
 
     def save_graduation_year(self, current_edu_year: int, all_edu_years: int) -> int:
         """
@@ -705,16 +692,12 @@ class LeaderConfirmation(Interaction):
         is_first_term = now.month >= c.THRESHOLD_DATE[0] and now.day >= c.THRESHOLD_DATE[1]
         graduation_year = now.year + (all_edu_years - current_edu_year) + is_first_term
 
-        connection = connect(c.DATABASE)
-        cursor = connection.cursor()
-        cursor.execute(
-            'UPDATE groups SET graduation = ? WHERE id = ?',
-            (graduation_year - 2000, self.group_id)
-        )
-        connection.commit()
-        cursor.close()
-        connection.close()
-        log.cl.info(log.ENTERS_EDU_YEAR.format(self.chat_id, current_edu_year, all_edu_years))
+        with a.database_cursor() as cursor:
+            cursor.execute(
+                'UPDATE groups SET graduation = ? WHERE id = ?',
+                (graduation_year - 2000, self.group_id)
+            )
+        log.cl.info(log.ENTERS_EDU_YEAR, self.chat_id, current_edu_year, all_edu_years)
 
         return graduation_year
 
@@ -726,7 +709,7 @@ def displaying_commands(record: a.ChatRecord, update: Update):
 
     Args: see src.bot.managers.deleting_data.__doc__.
     """
-    kpi_command = t.KPI_CAMPUS_COMMAND[record.language] if record.group_id // 10 ** 5 == c.KPI_ID else ''
+    kpi_command = t.KPI_CAMPUS_COMMAND[record.language] if record.group_id in c.KPI_GROUP_IDS else ''
 
     non_ordinary_commands = ''
     if record.role > c.ORDINARY_ROLE:
@@ -734,24 +717,26 @@ def displaying_commands(record: a.ChatRecord, update: Update):
         if record.role > c.ADMIN_ROLE:
             non_ordinary_commands += t.LEADER_COMMANDS[record.language]
 
-    familiarity = a.Familiarity(*record.familiarity)
-    if int(familiarity.commands):
+    if a.Familiarity.commands in record.familiarity:
         unfamiliar = ''
     else:
         unfamiliar = t.FT_COMMANDS[record.language]
-        Interaction.update_familiarity(record.id, familiarity, commands='1')
+        Interaction.update_familiarity(record.id, a.Familiarity.commands)
 
     text = t.COMMANDS[record.language].format(kpi_command, non_ordinary_commands, unfamiliar)
     update.effective_message.reply_text(text, quote=update.effective_chat.type != Chat.PRIVATE)
-    log.cl.info(log.COMMANDS.format(record.id))
+    log.cl.info(log.COMMANDS, record.id)
 
 
 class AddingAdmin(Interaction):
     COMMAND, UNAVAILABLE_MESSAGE, IS_PRIVATE = 'trust', t.UNAVAILABLE_ADDING_ADMIN, True
     ONGOING_MESSAGE, ALREADY_MESSAGE = t.ONGOING_ADDING_ADMIN, t.ALREADY_ADDING_ADMIN
+    FAMILIARITY = a.Familiarity.trust
+    __slots__ = ('ordinary_records',)
 
     def __init__(self, record: a.ChatRecord):
         super().__init__(record)
+        self.ordinary_records: list[tuple[int, str, int]] = None
 
         self.ask_new_admin()
         self.next_action = self.add_admin
@@ -761,9 +746,10 @@ class AddingAdmin(Interaction):
         This method makes the bot ask the leader which of their group's ordinary students to make an admin. The options
         are provided as inline buttons.
         """
-        ordinary_students = [
-            [InlineKeyboardButton(username, callback_data=f'{user_id} {username} {language}')]
-            for user_id, username, language in self.get_ordinary_records()
+        self.ordinary_records = self.get_ordinary_records()
+        ordinary_students = [  # using indices, the chosen student's record is then taken from the ones that are kept
+            [InlineKeyboardButton(username, callback_data=str(index))]
+            for index, (_, username, _) in enumerate(self.ordinary_records)
         ]
         markup = InlineKeyboardMarkup(ordinary_students)
 
@@ -776,21 +762,10 @@ class AddingAdmin(Interaction):
             identifiers. Namely, list of tuples that contain the student's telegram id, username or other identifier,
             and language (its index according to src.bot.config.LANGUAGES).
         """
-        connection = connect(c.DATABASE)
-        cursor = connection.cursor()
-
-        cursor.execute(  # the group's ordinary students
-            'SELECT id, username, language FROM chats '
-            'WHERE group_id = ? AND role = 0',
-            (self.group_id,)
-        )
-        ordinary_records: list[tuple[int, str, int]] = cursor.fetchall()
-
-        cursor.close()
-        connection.close()
-
-        ordinary_records.sort(key=lambda r: a.str_sort_key(r[1]))
-        return ordinary_records
+        return [  # the group's ordinary students
+            (r.id, r.username, r.language)
+            for r in a.get_related_chat_records(self.group_id) if r.role == c.ORDINARY_ROLE
+        ]
 
     def add_admin(self, update: Update):
         """
@@ -806,38 +781,30 @@ class AddingAdmin(Interaction):
         """
         query = update.callback_query
         try:
-            new_admin = query.data.split()
+            new_admin_id, new_admin_username, new_admin_language = self.ordinary_records[int(query.data)]
         except AttributeError:  # if the update is not caused by choosing a student
             return  # no response
 
         if not self.is_familiar:  # if the leader is adding an admin for the first time
-            self.update_familiarity(self.chat_id, self.familiarity, trust='1')
+            self.update_familiarity(self.chat_id, self.FAMILIARITY)
 
-        new_admin_id, new_admin_username, new_admin_language = int(new_admin[0]), new_admin[1], int(new_admin[2])
-
-        connection = connect(c.DATABASE)
-        cursor = connection.cursor()
-        cursor.execute(  # making the chosen ordinary student an admin
-            'UPDATE chats SET role = 1 WHERE id = ?',
-            (new_admin_id,)
-        )
-        connection.commit()
-        cursor.close()
-        connection.close()
-        log.cl.info(log.NOW_ADMIN.format(new_admin_id))
+        a.update_role(new_admin_id, c.ADMIN_ROLE)  # making the student an admin before anyone is told about it
+        log.cl.info(log.NOW_ADMIN, new_admin_id)
 
         bot.send_message(new_admin_id, t.YOU_NOW_ADMIN[new_admin_language].format(t.ADMIN_COMMANDS[new_admin_language]))
         query.message.edit_text(t.NOW_ADMIN[self.language].format(new_admin_username))
-
         self.terminate()
 
 
 class RemovingAdmin(Interaction):
     COMMAND, UNAVAILABLE_MESSAGE, IS_PRIVATE = 'distrust', t.UNAVAILABLE_REMOVING_ADMIN, True
     ONGOING_MESSAGE, ALREADY_MESSAGE = t.ONGOING_REMOVING_ADMIN, t.ALREADY_REMOVING_ADMIN
+    FAMILIARITY = a.Familiarity.distrust
+    __slots__ = ('admin_records', 'admin_id', 'admin_username', 'admin_language')
 
     def __init__(self, record: a.ChatRecord):
         super().__init__(record)
+        self.admin_records: list[tuple[int, str, int]] = None
         self.admin_id: int = None
         self.admin_username: str = None
         self.admin_language: int = None
@@ -850,9 +817,10 @@ class RemovingAdmin(Interaction):
         This method makes the bot ask the leader which admin of their group to make an ordinary student. The options are
         provided as inline buttons.
         """
-        admins = [
-            [InlineKeyboardButton(username, callback_data=f'{user_id} {username} {language}')]
-            for user_id, username, language in self.get_admin_records()
+        self.admin_records = self.get_admin_records()
+        admins = [  # using indices, the chosen admin's record is then taken from the ones that are kept
+            [InlineKeyboardButton(username, callback_data=str(index))]
+            for index, (_, username, _) in enumerate(self.admin_records)
         ]
         markup = InlineKeyboardMarkup(admins)
 
@@ -865,21 +833,9 @@ class RemovingAdmin(Interaction):
             Namely, list of tuples that contain the admin's telegram id, username or other identifier, and language (its
             index according to src.bot.config.LANGUAGES).
         """
-        connection = connect(c.DATABASE)
-        cursor = connection.cursor()
-
-        cursor.execute(  # the group's admins
-            'SELECT id, username, language FROM chats '
-            'WHERE group_id = ? AND role = 1',
-            (self.group_id,)
-        )
-        admin_records: list[tuple[int, str, int]] = cursor.fetchall()
-
-        cursor.close()
-        connection.close()
-
-        admin_records.sort(key=lambda r: a.str_sort_key(r[1]))
-        return admin_records
+        return [  # the group's admins
+            (r.id, r.username, r.language) for r in a.get_related_chat_records(self.group_id) if r.role == c.ADMIN_ROLE
+        ]
 
     def remove_admin(self, update: Update):
         """
@@ -895,22 +851,12 @@ class RemovingAdmin(Interaction):
         query = update.callback_query
 
         try:
-            admin = query.data.split()
+            self.admin_id, self.admin_username, self.admin_language = self.admin_records[int(query.data)]
         except AttributeError:  # if the update is not caused by choosing an admin
             return  # no response
 
-        self.admin_id, self.admin_username, self.admin_language = int(admin[0]), admin[1], int(admin[2])
-
-        connection = connect(c.DATABASE)
-        cursor = connection.cursor()
-        cursor.execute(  # making the chosen admin an ordinary student
-            'UPDATE chats SET role = 0 WHERE id = ?',
-            (self.admin_id,)
-        )
-        connection.commit()
-        cursor.close()
-        connection.close()
-        log.cl.info(log.NO_MORE_ADMIN.format(self.admin_id))
+        a.update_role(self.admin_id, c.ORDINARY_ROLE)  # making the admin an ordinary one before the leader is told
+        log.cl.info(log.NO_MORE_ADMIN, self.admin_id)
 
         msg = (t.ASK_TO_NOTIFY_FORMER if self.is_familiar else t.FT_ASK_TO_NOTIFY_FORMER)
         self.ask_polar(msg[self.language].format(self.admin_username), query)
@@ -935,11 +881,11 @@ class RemovingAdmin(Interaction):
             return  # no response
 
         if not self.is_familiar:  # if the leader is removing an admin for the first time
-            self.update_familiarity(self.chat_id, self.familiarity, distrust='1')
+            self.update_familiarity(self.chat_id, self.FAMILIARITY)
 
         if is_positive:
             bot.send_message(self.admin_id, t.YOU_NO_MORE_ADMIN[self.admin_language])
-            log.cl.info(log.FORMER_NOTIFIED.format(self.admin_id))
+            log.cl.info(log.FORMER_NOTIFIED, self.admin_id)
             query.message.edit_text(t.FORMER_ADMIN_NOTIFIED[self.language])
         else:
             query.message.edit_text(t.FORMER_NOT_NOTIFIED[self.language])
@@ -954,15 +900,7 @@ def displaying_events(record: a.ChatRecord, update: Update):
 
     Args: see src.bot.manager.deleting_data.__doc__.
     """
-    connection = connect(c.DATABASE)
-    cursor = connection.cursor()
-    cursor.execute(  # the group's upcoming events
-        'SELECT events FROM groups WHERE id = ?',
-        (record.group_id,)
-    )
-    events_str = cursor.fetchone()[0]
-    cursor.close()
-    connection.close()
+    events_str = a.read_group_data('events', record.group_id)  # the group's upcoming events
 
     try:
         events_str = events_str.split('\n')
@@ -972,13 +910,14 @@ def displaying_events(record: a.ChatRecord, update: Update):
         now = datetime.now()
         today = datetime(now.year, now.month, now.day, 0, 0)
 
+        weekdays = t.LANGUAGE_WEEKDAYS[record.language]  # in the user's language
         events: dict[int, list[str]] = {}
         for event_str in events_str:
-            event = a.str_to_datetime(event_str)
+            event = a.str_to_datetime(event_str, now)
 
             # if the event has not passed or has passed not more than an hour ago
             if event >= now:
-                event_str = f"{t.WEEKDAYS[int(event_str[0])][record.language]} {event_str[2:].rpartition('|')[0]}"
+                event_str = weekdays[ord(event_str[0]) - a.ZERO] + event_str[1:].rpartition('|')[0]
 
                 if (days_left := (event - today).days) not in events:
                     events[days_left] = [event_str]
@@ -989,7 +928,7 @@ def displaying_events(record: a.ChatRecord, update: Update):
 
     is_not_private = update.effective_chat.type != Chat.PRIVATE
     update.effective_message.reply_text(text, ParseMode.HTML, quote=is_not_private)
-    log.cl.info(log.EVENTS.format(record.id))
+    log.cl.info(log.EVENTS, record.id)
 
 
 def displaying_info(record: a.ChatRecord, update: Update):
@@ -999,23 +938,17 @@ def displaying_info(record: a.ChatRecord, update: Update):
 
     Args: see src.bot.manager.deleting_data.__doc__.
     """
-    connection = connect(c.DATABASE)
-    cursor = connection.cursor()
-    cursor.execute(  # the group's saved information
-        'SELECT info FROM groups WHERE id = ?',
-        (record.group_id,)
-    )
-    info = cursor.fetchone()[0] or t.NO_INFO[record.language]
-    cursor.close()
-    connection.close()
+    info = a.read_group_data('info', record.group_id) or t.NO_INFO[record.language]  # the group's saved information
 
     update.effective_message.reply_text(info, quote=update.effective_chat.type != Chat.PRIVATE)
-    log.cl.info(log.INFO.format(record.id))
+    log.cl.info(log.INFO, record.id)
 
 
 class AddingEvent(Interaction):
     COMMAND, UNAVAILABLE_MESSAGE, IS_PRIVATE = 'new', t.UNAVAILABLE_ADDING_EVENT, True
     ONGOING_MESSAGE, ALREADY_MESSAGE = t.ONGOING_ADDING_EVENT, t.ALREADY_ADDING_EVENT
+    FAMILIARITY = a.Familiarity.new
+    __slots__ = ('event', 'cut_event', 'date', 'weekday_index', 'date_str', 'time_str', 'num_to_answer')
 
     def __init__(self, record: a.ChatRecord):
         super().__init__(record)
@@ -1061,13 +994,13 @@ class AddingEvent(Interaction):
         """
         if not (text := self.inspect_date(update.effective_message.text)):  # if the given date is valid
             if not self.is_familiar:  # if the admin is adding an event for the first time
-                self.update_familiarity(self.chat_id, self.familiarity, new='1')
+                self.update_familiarity(self.chat_id, self.FAMILIARITY)
 
             if self.save_event():  # if the event has not already been added
                 self.notify()  # overwrites reference to this instance with an EventAnswering one
-                log.cl.info(log.ASKED_EVENT.format(self.group_id, self.cut_event))
+                log.cl.info(log.ASKED_EVENT, self.group_id, self.cut_event)
             else:  # if the event has already been added
-                log.cl.info(log.ADDS_DUPLICATE.format(self.chat_id, self.cut_event))
+                log.cl.info(log.ADDS_DUPLICATE, self.chat_id, self.cut_event)
                 self.send_message(t.ALREADY_ADDED[self.language])
                 self.terminate()
 
@@ -1086,62 +1019,47 @@ class AddingEvent(Interaction):
 
         Returns (None or str): None if the date is valid. Otherwise, text describing why the given date is invalid.
         """
-        dates = findall(c.DATE_PATTERN, date)
-
-        if (num_dates := len(dates)) == 1:
-            day_str, month_str, time, hour_str, minute_str = dates[0]
-            day, month = int(day_str), int(month_str)
-
-            if month <= 12:
-
-                if month >= 1:
-                    now = datetime.now()
-                    next_february_year = now.year + 1 if now.month > 2 else now.year
-                    next_february_length = 28 if next_february_year % 4 else 29
-
-                    if day <= (31, next_february_length, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)[month - 1]:
-
-                        if day >= 1:  # if the given date is valid
+        if not (dates := c.DATE_PATTERN.search(date)):  # if no dates are given
+            return t.INVALID_DATE[self.language]
 
-                            if time:  # if time is given
-                                hour, minute = int(hour_str), int(minute_str)
+        if c.DATE_PATTERN.search(date, dates.end()):  # if multiple dates are given
+            return t.MULTIPLE_DATES[self.language]
 
-                                if hour <= 23:
+        day_str, month_str, hour_str, minute_str = dates.groups()
+        day, month = int(day_str), int(month_str)
 
-                                    if minute <= 59:  # if the given time is valid
-                                        self.time_str = f', {hour:02}:{minute:02}'
-                                    else:  # if the given minute is greater than 59
-                                        return t.INVALID_MINUTE[self.language]
+        if month > 12:
+            return t.MONTH_OVER_12[self.language].format(month)
 
-                                else:
-                                    return t.INVALID_HOUR[self.language]
+        if not month:
+            return t.MONTH_0[self.language]
 
-                            else:
-                                hour, minute = 23, 59
+        now = datetime.now()
+        next_february_year = now.year + 1 if now.month > 2 else now.year
 
-                            date_this_year = datetime(now.year, month, day, hour, minute)
-                            self.date = date_this_year if date_this_year > now \
-                                else datetime(now.year + 1, month, day, hour, minute)
-                            self.weekday_index = int(self.date.strftime('%u')) - 1  # 0 to 6 = Monday to Sunday
-                            self.date_str = f'{self.weekday_index} {day:02}.{month:02}{self.time_str}'
+        if day > c.MONTH_LENGTHS[month - 1] + (month == 2 and isleap(next_february_year)):
+            return t.DAY_OVER_MONTH_LENGTH[self.language]
 
-                        else:  # if the given day is 0
-                            return t.DAY_0[self.language]
+        if not day:
+            return t.DAY_0[self.language]
 
-                    else:
-                        return t.DAY_OVER_MONTH_LENGTH[self.language]
+        if hour_str:  # if time is given
+            hour, minute = int(hour_str), int(minute_str)
 
-                else:  # if the given month is 0
-                    return t.MONTH_0[self.language]
+            if hour > 23:
+                return t.INVALID_HOUR[self.language]
 
-            else:
-                return t.MONTH_OVER_12[self.language].format(month)
+            if minute > 59:
+                return t.INVALID_MINUTE[self.language]
 
-        elif not num_dates:  # if no dates are given
-            return t.INVALID_DATE[self.language]
+            self.time_str = f', {hour:02}:{minute:02}'
+        else:
+            hour, minute = 23, 59
 
-        else:  # if multiple dates are given
-            return t.MULTIPLE_DATES[self.language]
+        date_this_year = datetime(now.year, month, day, hour, minute)
+        self.date = date_this_year if date_this_year > now else datetime(now.year + 1, month, day, hour, minute)
+        self.weekday_index = self.date.weekday()  # 0 to 6 = Monday to Sunday
+        self.date_str = f'{self.weekday_index} {day:02}.{month:02}{self.time_str}'
 
         return None
 
@@ -1158,35 +1076,36 @@ class AddingEvent(Interaction):
         self.cut_event = a.cut(self.event)
         is_unique = True
 
-        connection = connect(c.DATABASE)
-        cursor = connection.cursor()
-
-        cursor.execute(  # the group's upcoming events
-            'SELECT events FROM groups WHERE id = ?',
-            (self.group_id,)
-        )
-        try:
-            events = cursor.fetchone()[0].split('\n')
-        except AttributeError:  # if the group has no upcoming events
-            updated_events = f'{self.event}|'
-        else:  # if the group has upcoming events
-            if self.event not in [event.rpartition('|')[0] for event in events]:  # if the event is unique
-                events.append(f'{self.event}|')
-                events.sort(key=a.str_to_datetime)
-                updated_events = '\n'.join(events)
-            else:  # if the event has already been added
-                is_unique = False
-
-        if is_unique:
-            cursor.execute(  # updating the group's upcoming events
-                'UPDATE groups SET events = ? WHERE id = ?',
-                (updated_events, self.group_id)
+        with a.database_cursor() as cursor:  # the events are read and updated under the lock, so no change is lost
+            cursor.execute(  # the group's upcoming events
+                'SELECT events FROM groups WHERE id = ?',
+                (self.group_id,)
             )
-
-        connection.commit()
-        cursor.close()
-        connection.close()
-        log.cl.info(log.ADDS.format(self.chat_id, self.cut_event))
+            try:
+                events = cursor.fetchone()[0].split('\n')
+            except AttributeError:  # if the group has no upcoming events
+                updated_events = f'{self.event}|'
+            else:  # if the group has upcoming events
+                # the events are stored sorted, so the new one is inserted after the last one that is not later, which
+                # is found by binary search that only converts the events it compares with to datetime
+                event_dates = a.EventDates(events)
+                index = bisect_right(event_dates, self.date)
+                same_date_index = bisect_left(event_dates, self.date, hi=index)  # the first event at the same date
+
+                if self.event in [event.rpartition('|')[0] for event in events[same_date_index:index]]:  # if added
+                    is_unique = False
+                else:  # if the event is unique
+                    events.insert(index, f'{self.event}|')
+                    updated_events = '\n'.join(events)
+
+            if is_unique:
+                cursor.execute(  # updating the group's upcoming events
+                    'UPDATE groups SET events = ? WHERE id = ?',
+                    (updated_events, self.group_id)
+                )
+        a.forget_group_data('events', self.group_id)
+
+        log.cl.info(log.ADDS, self.chat_id, self.cut_event)
 
         return is_unique
 
@@ -1199,82 +1118,71 @@ class AddingEvent(Interaction):
         answer about all events before it.
         """
         student_records, group_chat_records = self.get_related_records()
-        currently_asked = [
-            r[0] for r in student_records if r[0] in current and isinstance(current[r[0]], EventAnswering)
-        ]
-        event_answering = EventAnswering(self.group_id) if not currently_asked else current[currently_asked[0]]
+        event_answering = event_answerings.get(self.group_id) or EventAnswering(self.group_id)
+        currently_asked = [r[0] for r in student_records if current.get(r[0]) is event_answering]
 
-        # the event with the weekday in each language
-        translated_event = [
-            f'{t.WEEKDAYS[self.weekday_index][index]} {self.event[2:]}' for index in range(len(c.LANGUAGES))
-        ]
+        date_time = self.event[2:]  # the event without its weekday, which is translated
+        translated_event = [f'{weekday} {date_time}' for weekday in t.WEEKDAYS[self.weekday_index]]  # in each language
 
-        answers = [
-            [[
-                InlineKeyboardButton(t.YES[index], callback_data='y'),
-                InlineKeyboardButton(t.NO[index], callback_data='n')
-            ]]
-            for index in range(len(c.LANGUAGES))
-        ]
-        markup = [InlineKeyboardMarkup(buttons) for buttons in answers]
-
-        asked: dict[int, tuple[int, int]] = {}
+        # the messages are sent in parallel, ids of the ones sent to students are needed to edit them later
+        sendings: dict[int, tuple[Future, int]] = {}
         for user_id, language, familiarity in student_records:
 
             if user_id not in currently_asked:  # if the student has no unanswered events
                 current[user_id] = event_answering
 
-                msg = t.NEW_EVENT if int(a.Familiarity(*familiarity).event_answer) else t.FT_NEW_EVENT
+                msg = t.NEW_EVENT if a.Familiarity.event_answer in familiarity else t.FT_NEW_EVENT
                 text = msg[language].format(translated_event[language], choice(t.EVENT_QUESTION[language]))
 
-                message_id = bot.send_message(user_id, text, ParseMode.HTML, reply_markup=markup[language]).message_id
-                asked[user_id] = (message_id, language)
+                markup = polar_markups[language]
+                sendings[user_id] = (sending_pool.submit(send_limited, user_id, text, ParseMode.HTML,
+                                                         reply_markup=markup), language)
 
             else:  # if the student has unanswered events
                 text = t.NEW_EVENT[language].format(translated_event[language], '')
 
-                asked[user_id] = (bot.send_message(user_id, text).message_id, language)
-
-        event_answering.add_event(self.event, asked)
+                sendings[user_id] = (sending_pool.submit(send_limited, user_id, text), language)
 
+        group_chat_sendings: list[Future] = []
         for chat_id, language in group_chat_records:
             text = t.NEW_EVENT[language].format(translated_event[language], '')
-            bot.send_message(chat_id, text, ParseMode.HTML)
+            group_chat_sendings.append(sending_pool.submit(send_limited, chat_id, text, ParseMode.HTML))
 
-    def get_related_records(self) -> tuple[list[tuple[int, int, str]], list[tuple[int, int]]]:
-        """
-        Returns (tuple[list[tuple[int, int, str]], list[tuple[int, int]]]): chats related to the admin's group. Namely,
-            list of student records (tuples that contain the student's telegram id, language (its index according to
-            src.bot.config.LANGUAGES), and familiarity with the bot's interactions) and list of group-chat records
-            (tuples that contain the chat's id and language index).
-        """
-        connection = connect(c.DATABASE)
-        cursor = connection.cursor()
+        asked: dict[int, tuple[int, int]] = {
+            user_id: (sending.result().message_id, language) for user_id, (sending, language) in sendings.items()
+        }
+        event_answering.add_event(self.event, asked)
 
-        cursor.execute(  # chats related to the group
-            'SELECT id, language, familiarity FROM chats WHERE group_id = ? AND type = 0',
-            (self.group_id,)
-        )
-        student_records: list[tuple[int, int, str]] = cursor.fetchall()
+        for sending in group_chat_sendings:
+            sending.result()  # waiting for the messages to be sent, an exception raised while sending is raised here
 
-        cursor.execute(  # chats related to the group
-            'SELECT id, language FROM chats WHERE group_id = ? AND type <> 0',
-            (self.group_id,)
-        )
-        group_chat_records: list[tuple[int, int]] = cursor.fetchall()
+    def get_related_records(self) -> tuple[list[tuple[int, int, a.Familiarity]], list[tuple[int, int]]]:
+        """
+        Returns (tuple[list[tuple[int, int, a.Familiarity]], list[tuple[int, int]]]): chats related to the admin's
+            group. Namely, list of student records (tuples that contain the student's telegram id, language (its index
+            according to src.bot.config.LANGUAGES), and familiarity with the bot's interactions) and list of group-chat
+            records (tuples that contain the chat's id and language index).
+        """
+        student_records: list[tuple[int, int, a.Familiarity]] = []
+        group_chat_records: list[tuple[int, int]] = []
 
-        cursor.close()
-        connection.close()
+        for r in a.get_related_chat_records(self.group_id):  # chats related to the group
+            if not r.type:  # if the chat is a student's private one
+                student_records.append((r.id, r.language, r.familiarity))
+            else:  # if the chat is a group chat
+                group_chat_records.append((r.id, r.language))
 
         return student_records, group_chat_records
 
 
 class EventAnswering:
     Asked = dict[int, tuple[int, int]]
+    __slots__ = ('group_id', 'queue', 'next_action')
 
     def __init__(self, group_id: int):
         self.group_id = group_id
         self.queue = OrderedDict[str, self.Asked]()
+        event_answerings[group_id] = self
 
         self.next_action = self.handle_answer
 
@@ -1299,13 +1207,13 @@ class EventAnswering:
 
         user_id = update.effective_user.id
         record = a.get_chat_record(user_id)
-        language, familiarity = record.language, a.Familiarity(*record.familiarity)
+        language, familiarity = record.language, record.familiarity
         event, event_index = self.determine_event(user_id)
         cut_event = a.cut(event)
 
         # if the user is answering for the first time whether they want to be reminded about the event
-        if not int(familiarity.event_answer):
-            Interaction.update_familiarity(user_id, familiarity, event_answer='1')
+        if a.Familiarity.event_answer not in familiarity:
+            Interaction.update_familiarity(user_id, a.Familiarity.event_answer)
 
         if a.str_to_datetime(event) > datetime.now():
             if is_positive:
@@ -1319,7 +1227,7 @@ class EventAnswering:
             else:
                 log_msg, text = log.DISAGREES_LATE, t.WOULD_EXPECT_NO_NOTIFICATIONS[language]
 
-        log.cl.info(log_msg.format(user_id, cut_event))
+        log.cl.info(log_msg, user_id, cut_event)
         event_text = query.message.text.rpartition('\n\n')[0]
         query.message.edit_text(f"{event_text}\n\n{text}")
 
@@ -1332,7 +1240,10 @@ class EventAnswering:
             del self.queue[event][user_id]
         else:  # if the user is the only one who had not answered about the event
             del self.queue[event]
-            log.cl.info(log.ALL_ANSWERED_EVENT.format(self.group_id, cut_event))
+            log.cl.info(log.ALL_ANSWERED_EVENT, self.group_id, cut_event)
+
+            if not self.queue:  # if the group's students have answered about all the events
+                del event_answerings[self.group_id]
 
     def determine_event(self, user_id: int) -> tuple[str, int]:
         """
@@ -1354,27 +1265,22 @@ class EventAnswering:
             event (str): event that will be updated.
             user_id (int): id of the student who agreed to be reminded about the event.
         """
-        connection = connect(c.DATABASE)
-        cursor = connection.cursor()
-
-        cursor.execute(
-            'SELECT events FROM groups WHERE id = ?',
-            (self.group_id,)
-        )
-        events = cursor.fetchone()[0].split('\n')
-
-        for i, event_ in enumerate(events):
-            if event_.rpartition('|')[0] == event:
-                events[i] += f' {user_id}'
+        with a.database_cursor() as cursor:
+            cursor.execute(
+                'SELECT events FROM groups WHERE id = ?',
+                (self.group_id,)
+            )
+            events = cursor.fetchone()[0].split('\n')
 
-        cursor.execute(
-            'UPDATE groups SET events = ? where id = ?',
-            ('\n'.join(events), self.group_id)
-        )
+            for i, event_ in enumerate(events):
+                if event_.rpartition('|')[0] == event:
+                    events[i] += f' {user_id}'
 
-        connection.commit()
-        cursor.close()
-        connection.close()
+            cursor.execute(
+                'UPDATE groups SET events = ? WHERE id = ?',
+                ('\n'.join(events), self.group_id)
+            )
+        a.forget_group_data('events', self.group_id)
 
     def ask_next_event(self, user_id: int, event_index: int):
         """
@@ -1388,16 +1294,10 @@ class EventAnswering:
 
         message_id, language = self.queue[next_event][user_id]
 
-        next_event = f'{t.WEEKDAYS[int(next_event[0])][language]} {next_event[2:]}'
+        next_event = f'{t.LANGUAGE_WEEKDAYS[language][ord(next_event[0]) - a.ZERO]} {next_event[2:]}'
         text = t.NEW_EVENT[language].format(next_event, choice(t.EVENT_QUESTION[language]))
 
-        answers = [[
-            InlineKeyboardButton(t.YES[language], callback_data='y'),
-            InlineKeyboardButton(t.NO[language], callback_data='n')
-        ]]
-        markup = InlineKeyboardMarkup(answers)
-
-        bot.edit_message_text(text, user_id, message_id, reply_markup=markup)
+        bot.edit_message_text(text, user_id, message_id, reply_markup=polar_markups[language])
 
     def add_event(self, event: str, asked: Asked):
         """
@@ -1429,15 +1329,6 @@ class EventAnswering:
 
         event_index = tuple(self.queue.keys()).index(event)
 
-        translated_answers = [
-            [[
-                InlineKeyboardButton(t.YES[index], callback_data='y'),
-                InlineKeyboardButton(t.NO[index], callback_data='n')
-            ]]
-            for index in range(len(c.LANGUAGES))
-        ]
-        translated_markup = [InlineKeyboardMarkup(answers) for answers in translated_answers]
-
         for user_id, (message_id, language) in self.queue[event].items():
             bot.delete_message(user_id, message_id)  # deleting the question about the event
 
@@ -1451,12 +1342,15 @@ class EventAnswering:
                     next_event = tuple(self.queue.keys())[event_index + 1]
                     message_id = self.queue[next_event][user_id][0]
 
-                    next_event = f'{t.WEEKDAYS[int(next_event[0])][language]} {next_event[2:]}'
+                    next_event = f'{t.LANGUAGE_WEEKDAYS[language][ord(next_event[0]) - a.ZERO]} {next_event[2:]}'
                     text = t.NEW_EVENT[language].format(next_event, choice(t.EVENT_QUESTION[language]))
-                    bot.edit_message_text(text, user_id, message_id, reply_markup=translated_markup[language])
+                    bot.edit_message_text(text, user_id, message_id, reply_markup=polar_markups[language])
 
         not_answered = tuple(self.queue[event].keys())
         del self.queue[event]
+        if not self.queue:  # if there are no more events that the group's students are asked about
+            del event_answerings[self.group_id]
+
         return not_answered
 
     def respond(self, command: str, message: Message):
@@ -1465,7 +1359,7 @@ class EventAnswering:
 
         Args: see src.bot.interactions.Interaction.respond.__doc__.
         """
-        log.cl.info(log.INTERRUPTS.format(message.from_user.id, command, type(self).__name__))
+        log.cl.info(log.INTERRUPTS, message.from_user.id, command, type(self).__name__)
 
         user_id = message.from_user.id
         event_index = self.determine_event(user_id)[1]
@@ -1480,10 +1374,13 @@ class EventAnswering:
 class CancelingEvent(Interaction):
     COMMAND, UNAVAILABLE_MESSAGE, IS_PRIVATE = 'cancel', t.UNAVAILABLE_CANCELING_EVENT, True
     ONGOING_MESSAGE, ALREADY_MESSAGE = t.ONGOING_CANCELING_EVENT, t.ALREADY_CANCELING_EVENT
+    FAMILIARITY = a.Familiarity.cancel
+    __slots__ = ('events', 'stored_events')
 
     def __init__(self, record: a.ChatRecord, events: str):
         super().__init__(record)
         self.events = [event.rpartition('|')[0] for event in events.split('\n')]
+        self.stored_events = events  # the group's events as they were stored when the interaction started
 
         self.ask_event()
         self.next_action = self.delete_event
@@ -1493,9 +1390,10 @@ class CancelingEvent(Interaction):
         This method makes the bot ask the admin which of the group's upcoming events to cancel. The options
         are provided as inline buttons.
         """
+        now, weekdays = datetime.now(), t.LANGUAGE_WEEKDAYS[self.language]
         events = [  # the group's upcoming events with their weekdays in the admin's language
-            [InlineKeyboardButton(f"{t.WEEKDAYS[int(event[0])][self.language]} {event[2:]}", callback_data=str(index))]
-            for index, event in enumerate(self.events) if a.str_to_datetime(event) >= datetime.now()
+            [InlineKeyboardButton(f'{weekdays[ord(event[0]) - a.ZERO]} {event[2:]}', callback_data=str(index))]
+            for index, event in enumerate(self.events) if a.str_to_datetime(event, now) >= now
         ]
         markup = InlineKeyboardMarkup(events)
 
@@ -1506,9 +1404,9 @@ class CancelingEvent(Interaction):
         This method is called when the bot receives an update after the admin is asked which of the group's upcoming
         events to cancel. If the update is not caused by choosing one (by clicking on one of the provided inline
         buttons), it is ignored. Otherwise, the chosen event is deleted by updating the group's record in the database,
-        and the admin's groupmates are notified about this. It is necessary to get the group's upcoming events from the
-        database again in order not to lose events that may have been added by the admin's groupmates during the
-        interaction.
+        and the admin's groupmates are notified about this. The update only succeeds if the group's upcoming events are
+        still the ones that the interaction has started with, so they are not read again. Otherwise, they are read
+        again in order not to lose events that may have been added by the admin's groupmates during the interaction.
 
         Args:
             update (telegram.Update): update received after the admin is asked which of the group's upcoming events to
@@ -1522,46 +1420,29 @@ class CancelingEvent(Interaction):
             return  # no response
 
         if not self.is_familiar:  # if the admin is canceling an upcoming event for the first time
-            self.update_familiarity(self.chat_id, self.familiarity, cancel='1')
-
-        connection = connect(c.DATABASE)
-        cursor = connection.cursor()
+            self.update_familiarity(self.chat_id, self.FAMILIARITY)
 
-        cursor.execute(  # the group's upcoming events
-            'SELECT events FROM groups WHERE id = ?',
-            (self.group_id,)
-        )
-        try:
-            events = cursor.fetchone()[0].split('\n')
-        except AttributeError:  # if there are no upcoming events
-            updated_events = None
-        else:  # if there are upcoming events
-            for i, event_ in enumerate(events):
-                if event_.rpartition('|')[0] == event:
-                    del events[i]
-                    break
-
-            updated_events = '\n'.join(events)
-
-        if updated_events:  # if there are upcoming events besides the canceled one
-            cursor.execute(  # updating the group's upcoming events
-                'UPDATE groups SET events = ? WHERE id = ?',
-                (updated_events, self.group_id)
-            )
-        else:  # if the canceled event is the only upcoming event or there are none
-            cursor.execute(  # clearing the group's upcoming events
-                'UPDATE groups SET events = NULL WHERE id = ?',
-                (self.group_id,)
+        with a.database_cursor() as cursor:  # the events are read and updated under the lock, so no change is lost
+            cursor.execute(  # updating the group's upcoming events if they have not changed during the interaction
+                'UPDATE groups SET events = ? WHERE id = ? AND events = ?',
+                (self.without_event(self.stored_events, event), self.group_id, self.stored_events)
             )
-
-        connection.commit()
-        cursor.close()
-        connection.close()
-        log.cl.info(log.CANCELS.format(self.chat_id, a.cut(event)))
-
-        translated_event = [
-            f'{t.WEEKDAYS[int(event[0])][index]} {event[2:]}' for index in range(len(c.LANGUAGES))
-        ]
+            if not cursor.rowcount:  # if the group's events have changed during the interaction
+                cursor.execute(  # the group's upcoming events
+                    'SELECT events FROM groups WHERE id = ?',
+                    (self.group_id,)
+                )
+                events = cursor.fetchone()[0]
+                cursor.execute(  # updating the group's upcoming events
+                    'UPDATE groups SET events = ? WHERE id = ?',
+                    (self.without_event(events, event) if events else None, self.group_id)
+                )
+        a.forget_group_data('events', self.group_id)
+
+        log.cl.info(log.CANCELS, self.chat_id, a.cut(event))
+
+        date_time = event[2:]  # the event without its weekday, which is translated into each language
+        translated_event = [f'{weekday} {date_time}' for weekday in t.WEEKDAYS[ord(event[0]) - a.ZERO]]
 
         query.message.edit_text(t.EVENT_CANCELED[self.language].format(translated_event[self.language]))
         self.notify(event, translated_event)
@@ -1578,34 +1459,39 @@ class CancelingEvent(Interaction):
             event (str): the canceled event.
             translated_event (tuple[str]): the canceled event in each language, according to src.bot.config.LANGUAGES.
         """
-        connection = connect(c.DATABASE)
-        cursor = connection.cursor()
-
-        cursor.execute(  # chats related to the group w/o the admin
-            'SELECT id, language FROM chats '
-            'WHERE group_id = ? AND id <> ?',
-            (self.group_id, self.chat_id)
-        )
-        related_records: list[tuple[int, int]] = cursor.fetchall()
-
-        cursor.close()
-        connection.close()
+        related_records = [  # chats related to the group w/o the admin
+            (r.id, r.language) for r in a.get_related_chat_records(self.group_id) if r.id != self.chat_id
+        ]
 
-        not_answered = ()
-        for chat_id, language in related_records:
-            if chat_id in current and isinstance(current[chat_id], EventAnswering):
-                not_answered = current[chat_id].cancel_question(event)
-                break
+        event_answering = event_answerings.get(self.group_id)
+        not_answered = event_answering.cancel_question(event) if event_answering else ()
 
+        sendings: list[Future] = []  # the messages are sent in parallel
         for chat_id, language in related_records:
             if chat_id not in not_answered:  # if the student has answered about the event
                 text = t.EVENT_CANCELED[language].format(translated_event[language])
-                bot.send_message(chat_id, text, ParseMode.HTML)
+                sendings.append(sending_pool.submit(send_limited, chat_id, text, ParseMode.HTML))
+
+        for sending in sendings:
+            sending.result()  # waiting for the messages to be sent, an exception raised while sending is raised here
+
+    @staticmethod
+    def without_event(events: str, event: str) -> Union[str, None]:
+        """
+        Args:
+            events (str): the group's upcoming events as they are stored in the database.
+            event (str): the event that will be removed, without ids of the students that have agreed to be reminded.
+
+        Returns (str or None): the group's upcoming events except the given one. None if there are no others.
+        """
+        return '\n'.join([event_ for event_ in events.split('\n') if event_.rpartition('|')[0] != event]) or None
 
 
 class SavingInfo(Interaction):
     COMMAND, UNAVAILABLE_MESSAGE, IS_PRIVATE = 'save', t.UNAVAILABLE_SAVING_INFO, True
     ONGOING_MESSAGE, ALREADY_MESSAGE = t.ONGOING_SAVING_INFO, t.ALREADY_SAVING_INFO
+    FAMILIARITY = a.Familiarity.save
+    __slots__ = ('info',)
 
     def __init__(self, record: a.ChatRecord):
         super().__init__(record)
@@ -1625,7 +1511,7 @@ class SavingInfo(Interaction):
         """
         if '\n\n' not in (info := update.effective_message.text):
             if not self.is_familiar:  # if the admin is saving info for the first time
-                self.update_familiarity(self.chat_id, self.familiarity, save='1')
+                self.update_familiarity(self.chat_id, self.FAMILIARITY)
 
             self.save_info(info)
             self.notify(info)
@@ -1641,56 +1527,39 @@ class SavingInfo(Interaction):
         Args:
             new_info (str): the given information.
         """
-        connection = connect(c.DATABASE)
-        cursor = connection.cursor()
-
-        cursor.execute(  # the group's saved info
-            'SELECT info FROM groups WHERE id = ?',
-            (self.group_id,)
-        )
-        try:
-            info = cursor.fetchone()[0] + f'\n\n{new_info}'
-        except TypeError:
-            info = new_info
-
-        cursor.execute(  # updating the group's saved info
-            'UPDATE groups SET info = ? WHERE id = ?',
-            (info, self.group_id)
-        )
-
-        connection.commit()
-        cursor.close()
-        connection.close()
-        log.cl.info(log.SAVES.format(self.chat_id, a.cut(info)))
+        with a.database_cursor() as cursor:
+            cursor.execute(  # appending the given info to the group's saved info, which is concatenated by the database
+                'UPDATE groups SET info = COALESCE(info || ?, ?) WHERE id = ?',
+                (f'\n\n{new_info}', new_info, self.group_id)
+            )
+        a.forget_group_data('info', self.group_id)
+        log.cl.info(log.SAVES, self.chat_id, a.cut(new_info))
 
     def notify(self, info: str):
         """
         This method is the last step of saving information, which the interaction is terminates after. It sends a
         notification about the new information to chats that are related to the admin's group.
         """
-        connection = connect(c.DATABASE)
-        cursor = connection.cursor()
-
-        cursor.execute(  # chats related to the group
-            'SELECT id, language FROM chats WHERE group_id = ?',
-            (self.group_id,)
-        )
-        student_records: list[tuple[int, int]] = cursor.fetchall()
+        student_records = [(r.id, r.language) for r in a.get_related_chat_records(self.group_id)]  # related chats
 
-        cursor.close()
-        connection.close()
-
-        for user_id, language in student_records:
-            bot.send_message(user_id, t.NEW_INFO[language].format(info))
+        sendings = [  # the messages are sent in parallel
+            sending_pool.submit(send_limited, user_id, t.NEW_INFO[language].format(info))
+            for user_id, language in student_records
+        ]
+        for sending in sendings:
+            sending.result()  # waiting for the messages to be sent, an exception raised while sending is raised here
 
 
 class DeletingInfo(Interaction):
     COMMAND, UNAVAILABLE_MESSAGE, IS_PRIVATE = 'delete', t.UNAVAILABLE_DELETING_INFO, True
     ONGOING_MESSAGE, ALREADY_MESSAGE = t.ONGOING_DELETING_INFO, t.ALREADY_DELETING_INFO
+    FAMILIARITY = a.Familiarity.delete
+    __slots__ = ('info', 'stored_info')
 
     def __init__(self, record: a.ChatRecord, info: str):
         super().__init__(record)
         self.info = info.split('\n\n')
+        self.stored_info = info  # the group's info as it was stored when the interaction started
 
         self.ask_info()
         self.next_action = self.delete_info
@@ -1713,8 +1582,9 @@ class DeletingInfo(Interaction):
         after. It is called when the bot receives an update after the admin is asked which piece of their group's saved
         information to delete. If the update is not caused by choosing one (by clicking on one of the provided inline
         buttons), it is ignored. Otherwise, the chosen piece of information is deleted by updating the group's record in
-        the database. It is necessary to get the group's saved information from the database again in order not to lose
-        information that may have been saved by the admin's groupmates during the interaction.
+        the database. The update only succeeds if the group's saved information is still the one that the interaction
+        has started with, so it is not read again. Otherwise, it is read again in order not to lose information that may
+        have been saved by the admin's groupmates during the interaction.
 
         Args:
             update (telegram.Update): update received after the admin is asked which piece of their group's saved
@@ -1728,50 +1598,54 @@ class DeletingInfo(Interaction):
             return  # no response
 
         if not self.is_familiar:  # if the admin is deleting a piece of the group's saved info for the first time
-            self.update_familiarity(self.chat_id, self.familiarity, delete='1')
-
-        connection = connect(c.DATABASE)
-        cursor = connection.cursor()
+            self.update_familiarity(self.chat_id, self.FAMILIARITY)
 
-        cursor.execute(  # the group's saved info
-            'SELECT info FROM groups WHERE id = ?',
-            (self.group_id,)
-        )
-        try:
-            info = cursor.fetchone()[0].split('\n\n')
-        except AttributeError:  # if the saved info is empty
-            updated_info = ''
-        else:  # if the saved info is not empty
-            try:
-                info.remove(info_piece)
-            except ValueError:  # if the info piece has already been deleted by one of the admin's groupmates
-                pass
-            updated_info = '\n\n'.join(info)
-
-        if updated_info:  # if there is saved info besides the deleted info piece
-            cursor.execute(
-                'UPDATE groups SET info = ? WHERE id = ?',
-                (updated_info, self.group_id)
-            )
-        else:  # if the deleted info piece is the only saved info
-            cursor.execute(  # clearing the group's saved info
-                'UPDATE groups SET info = NULL WHERE id = ?',
-                (self.group_id,)
+        with a.database_cursor() as cursor:  # the info is read and updated under the lock, so no change is lost
+            cursor.execute(  # updating the group's saved info if it has not changed during the interaction
+                'UPDATE groups SET info = ? WHERE id = ? AND info = ?',
+                (self.without_piece(self.stored_info, info_piece), self.group_id, self.stored_info)
             )
-
-        connection.commit()
-        cursor.close()
-        connection.close()
+            if not cursor.rowcount:  # if the group's saved info has changed during the interaction
+                cursor.execute(  # the group's saved info
+                    'SELECT info FROM groups WHERE id = ?',
+                    (self.group_id,)
+                )
+                info = cursor.fetchone()[0]
+                cursor.execute(  # updating the group's saved info
+                    'UPDATE groups SET info = ? WHERE id = ?',
+                    (self.without_piece(info, info_piece) if info else None, self.group_id)
+                )
+        a.forget_group_data('info', self.group_id)
         cut_info = a.cut(info_piece)
-        log.cl.info(log.DELETES.format(self.chat_id, cut_info))
+        log.cl.info(log.DELETES, self.chat_id, cut_info)
 
         query.message.edit_text(t.INFO_DELETED[self.language].format(cut_info))
         self.terminate()
 
+    @staticmethod
+    def without_piece(info: str, info_piece: str) -> Union[str, None]:
+        """
+        This method removes the piece from the group's saved information by finding its bounds, without splitting the
+        information into pieces. If the piece is not found (e.g. it has already been deleted), nothing is removed.
+
+        Args:
+            info (str): the group's saved information as it is stored in the database.
+            info_piece (str): the piece that will be removed.
+
+        Returns (str or None): the group's saved information without the given piece. None if there is no other.
+        """
+        bounded_info = f'\n\n{info}\n\n'  # so that every piece, including the first and the last, is between bounds
+        if (start := bounded_info.find(f'\n\n{info_piece}\n\n')) == -1:  # if there is no such piece
+            return info
+
+        return (bounded_info[:start] + bounded_info[start + len(info_piece) + 2:])[2:-2] or None
+
 
 class ClearingInfo(Interaction):
     COMMAND, UNAVAILABLE_MESSAGE, IS_PRIVATE = 'clear', t.UNAVAILABLE_CLEARING_INFO, True
     ONGOING_MESSAGE, ALREADY_MESSAGE = t.ONGOING_CLEARING_INFO, t.ALREADY_CLEARING_INFO
+    FAMILIARITY = a.Familiarity.clear
+    __slots__ = ()
 
     def __init__(self, record: a.ChatRecord):
         super().__init__(record)
@@ -1796,13 +1670,13 @@ class ClearingInfo(Interaction):
             return  # no response
 
         if not self.is_familiar:  # if the admin is clearing the saved info for the first time
-            self.update_familiarity(self.chat_id, self.familiarity, clear='1')
+            self.update_familiarity(self.chat_id, self.FAMILIARITY)
 
         if is_positive:
             self.clear_info()
             query.message.edit_text(t.INFO_CLEARED[self.language])
         else:
-            log.cl.info(log.KEEPS.format(self.chat_id))
+            log.cl.info(log.KEEPS, self.chat_id)
             query.message.edit_text(t.INFO_KEPT[self.language])
 
         self.terminate()
@@ -1811,21 +1685,20 @@ class ClearingInfo(Interaction):
         """
         This method deletes all saved information of the admin's group by updating its record in the database.
         """
-        connection = connect(c.DATABASE)
-        cursor = connection.cursor()
-        cursor.execute(  # clearing the group's saved info
-            'UPDATE groups SET info = NULL WHERE id = ?',
-            (self.group_id,)
-        )
-        connection.commit()
-        cursor.close()
-        connection.close()
-        log.cl.info(log.CLEARS.format(self.chat_id))
+        with a.database_cursor() as cursor:
+            cursor.execute(  # clearing the group's saved info
+                'UPDATE groups SET info = NULL WHERE id = ?',
+                (self.group_id,)
+            )
+        a.forget_group_data('info', self.group_id)
+        log.cl.info(log.CLEARS, self.chat_id)
 
 
 class NotifyingGroup(Interaction):
     COMMAND, UNAVAILABLE_MESSAGE, IS_PRIVATE = 'tell', t.UNAVAILABLE_NOTIFYING_GROUP, True
     ONGOING_MESSAGE, ALREADY_MESSAGE = t.ONGOING_NOTIFYING_GROUP, t.ALREADY_NOTIFYING_GROUP
+    FAMILIARITY = a.Familiarity.tell
+    __slots__ = ('username',)
 
     def __init__(self, record: a.ChatRecord):
         super().__init__(record)
@@ -1844,43 +1717,51 @@ class NotifyingGroup(Interaction):
             update (telegram.Update): update received after the leader is asked a message to notify their group with.
         """
         if not self.is_familiar:  # if the leader is notifying their group for the first time
-            self.update_familiarity(self.chat_id, self.familiarity, tell='1')
+            self.update_familiarity(self.chat_id, self.FAMILIARITY)
 
         related_records = self.get_related_records()
         message = update.effective_message
 
-        for chat_id, language in related_records:
-            bot.send_message(chat_id, t.GROUP_NOTIFICATION[language].format(self.username))
-            message.forward(chat_id)
+        sendings = [  # the chats are notified in parallel
+            sending_pool.submit(self.notify_chat, chat_id, language, message) for chat_id, language in related_records
+        ]
+        for sending in sendings:
+            sending.result()  # waiting for the chats to be notified, an exception raised while notifying is raised here
 
-        log.cl.info(log.NOTIFIED.format(self.group_id, a.cut(message.text)))
+        log.cl.info(log.NOTIFIED, self.group_id, a.cut(message.text))
         self.send_message(t.GROUP_NOTIFIED[self.language].format(len(related_records)))
         self.terminate()
 
+    def notify_chat(self, chat_id: int, language: int, message: Message):
+        """
+        This method makes the bot let the chat know that the leader is notifying the group, and forward the leader's
+        message to it right after. Both count towards src.bot.interactions.sending_limiter.
+
+        Args:
+            chat_id (int): id of the chat that will be notified.
+            language (int): the chat's language (its index according to src.bot.config.LANGUAGES).
+            message (telegram.Message): the leader's message that the group is notified with.
+        """
+        send_limited(chat_id, t.GROUP_NOTIFICATION[language].format(self.username))
+        sending_limiter.wait()
+        message.forward(chat_id)
+
     def get_related_records(self) -> list[tuple[int, int]]:
         """
         Returns (list[tuple[int, int]]): chats that are related to the admin's group. Namely, list of tuples that
             contain the chat's id and language (its index according to src.bot.config.LANGUAGES).
         """
-        connection = connect(c.DATABASE)
-        cursor = connection.cursor()
-
-        cursor.execute(  # chats related to the admin's group w/o the leader
-            'SELECT id, language FROM chats '
-            'WHERE group_id = ? AND id <> ?',
-            (self.group_id, self.chat_id)
-        )
-        related_records: list[tuple[int, int]] = cursor.fetchall()
-
-        cursor.close()
-        connection.close()
-
-        return related_records
+        return [  # chats related to the admin's group w/o the leader
+            (r.id, r.language) for r in a.get_related_chat_records(self.group_id) if r.id != self.chat_id
+        ]
 
 
 class AskingGroup(Interaction):
     COMMAND, UNAVAILABLE_MESSAGE, IS_PRIVATE = 'ask', t.UNAVAILABLE_ASKING_GROUP, True
     ONGOING_MESSAGE, ALREADY_MESSAGE = t.ONGOING_ASKING_GROUP, t.ALREADY_ASKING_GROUP
+    FAMILIARITY = a.Familiarity.ask
+    __slots__ = ('username', 'question_message_id', 'cut_question', 'group_chat', 'is_public',
+                 'leader_answer_message_id', 'group_answer_message_id', 'stop_markup', 'asked', 'answered', 'refused')
 
     def __init__(self, record: a.ChatRecord):
         super().__init__(record)
@@ -1893,11 +1774,10 @@ class AskingGroup(Interaction):
         self.leader_answer_message_id: int = None
         self.group_answer_message_id: int = None
 
-        stop = [[InlineKeyboardButton(t.STOP_ASKING_GROUP[self.language], callback_data='terminate')]]
-        self.stop_markup = InlineKeyboardMarkup(stop)
+        self.stop_markup = stop_asking_markups[self.language]
 
         self.asked: dict[int, tuple[str, int, a.Familiarity, int]] = None
-        self.answered: list[tuple[str, str]] = []
+        self.answered: list[str] = []  # usernames with answers, each formatted once
         self.refused: list[str] = []
 
         self.send_message((t.ASK_QUESTION if self.is_familiar else t.FT_ASK_QUESTION)[self.language])
@@ -1929,18 +1809,8 @@ class AskingGroup(Interaction):
         Returns (tuple[int, int] or None): record of the group chat of the leader's group. None if the group has not
             registered one.
         """
-        connection = connect(c.DATABASE)
-        cursor = connection.cursor()
-        cursor.execute(  # group chat of the leader's group
-            'SELECT id, language FROM chats '
-            'WHERE group_id = ? AND type <> 0',
-            (self.group_id,)
-        )
-        group_chat_record = cursor.fetchone()
-        cursor.close()
-        connection.close()
-
-        return group_chat_record
+        group_chat_records = [(r.id, r.language) for r in a.get_related_chat_records(self.group_id) if r.type != 0]
+        return min(group_chat_records, default=None)  # the one that the database returns first, chats are stored by ids
 
     def handle_answer(self, update: Update):
         """
@@ -1957,7 +1827,7 @@ class AskingGroup(Interaction):
         except AttributeError:  # if the update is not caused by giving the answer
             return  # no response
 
-        log.cl.info((log.MAKES_PUBLIC if self.is_public else log.MAKES_NON_PUBLIC).format(self.chat_id))
+        log.cl.info(log.MAKES_PUBLIC if self.is_public else log.MAKES_NON_PUBLIC, self.chat_id)
         self.launch()
 
     def launch(self):
@@ -1971,9 +1841,8 @@ class AskingGroup(Interaction):
         asked the question. Ids of the answer lists are saved so that they can be updated later to include new
         answers and refusals.
         """
-        self.ONGOING_MESSAGE = t.ONGOING_ANSWERING
         if not self.is_familiar:  # if the leader is asking their group for the first time
-            self.update_familiarity(self.chat_id, self.familiarity, ask='1')
+            self.update_familiarity(self.chat_id, self.FAMILIARITY)
 
         self.asked = self.get_asked()
 
@@ -1988,7 +1857,7 @@ class AskingGroup(Interaction):
         bot.edit_message_text(text, self.chat_id, self.leader_answer_message_id, parse_mode=ParseMode.HTML,
                               reply_markup=self.stop_markup)
 
-        markup = self.send_question()
+        self.send_question()
 
         if self.is_public:
             asked = t.ASKED[self.group_chat[1]].format(usernames)
@@ -1996,7 +1865,7 @@ class AskingGroup(Interaction):
             self.group_answer_message_id = bot.send_message(self.group_chat[0], text, ParseMode.HTML).message_id
 
             text = t.ASK_LEADER_ANSWER[self.language]
-            message_id = self.send_message(text, reply_markup=markup[self.language]).message_id
+            message_id = self.send_message(text, reply_markup=refuse_markups[self.language]).message_id
             self.asked[self.chat_id] = [self.username, self.language, self.familiarity, message_id]
 
         else:
@@ -2011,49 +1880,29 @@ class AskingGroup(Interaction):
             keys and lists that contain the student's username, language (its index according to
             src.bot.config.LANGUAGES), and familiarity with the bot's interactions, as the values.
         """
-        connection = connect(c.DATABASE)
-        cursor = connection.cursor()
-        cursor.execute(  # the leader's groupmates
-            'SELECT id, username, language, familiarity FROM chats '
-            'WHERE group_id = ? AND type = 0 AND id <> ?',
-            (self.group_id, self.chat_id)
-        )
-        asked_records: list[tuple[int, str, int, str]] = cursor.fetchall()
-        cursor.close()
-        connection.close()
-
-        return {
-            user_id: [username, language, a.Familiarity(*familiarity)]
-            for user_id, username, language, familiarity in asked_records
+        return {  # the leader's groupmates
+            r.id: [r.username, r.language, r.familiarity]
+            for r in a.get_related_chat_records(self.group_id) if r.type == 0 and r.id != self.chat_id
         }
 
-    def send_question(self) -> tuple[InlineKeyboardMarkup]:
+    def send_question(self):
         """
         This method makes the bot send the question. Namely, to forward the message that the leader sent the question
         in. An option to refuse to answer by clicking an inline button is also provided.
-
-        Returns(tuple[telegram.InlineKeyboardMarkup]): inline markups with a refuse inline button in each language,
-            according to src.bot.config.LANGUAGES.
         """
-        translated_refuse = [
-            [[InlineKeyboardButton(t.REFUSE_TO_ANSWER[index], callback_data='refuse')]]
-            for index in range(len(c.LANGUAGES))
-        ]
-        translated_markup = [InlineKeyboardMarkup(refuse) for refuse in translated_refuse]
 
         for user_id, (username, language, familiarity) in self.asked.items():
             current[user_id] = self
             bot.forward_message(user_id, self.chat_id, self.question_message_id)
 
-            text = (t.ASK_ANSWER if int(familiarity.answer) else t.FT_ASK_ANSWER)[language]
+            text = (t.ASK_ANSWER if a.Familiarity.answer in familiarity else t.FT_ASK_ANSWER)[language]
             info = (t.PUBLIC_ANSWER if self.is_public else t.PRIVATE_ANSWER)[language].format(self.username)
-            markup = translated_markup[language]
+            markup = refuse_markups[language]
             message_id = bot.send_message(user_id, text.format(info), reply_markup=markup).message_id
 
             self.asked[user_id] = (username, language, familiarity, message_id)
 
-        log.cl.info(log.ASKED.format(self.group_id, self.cut_question))
-        return translated_markup
+        log.cl.info(log.ASKED, self.group_id, self.cut_question)
 
     def handle_response(self, update: Update):
         """
@@ -2074,22 +1923,23 @@ class AskingGroup(Interaction):
         username, language, familiarity, message_id = self.asked[chat.id]
 
         # if the user is not the leader and is answering for the first time
-        if familiarity and not int(familiarity.answer):
-            self.update_familiarity(chat.id, familiarity, answer='1')
+        if familiarity is not None and a.Familiarity.answer not in familiarity:
+            self.update_familiarity(chat.id, a.Familiarity.answer)
 
         if not query:  # if an answer is given
             answer = message.text.replace('\n\n', '\n')
-            self.answered.append((username, answer))
-            log_text, msg = log.ANSWERS.format(chat.id, a.cut(answer)), t.ANSWER_SENT
+            self.answered.append(f'{username}\n{answer}')
+            log.cl.info(log.ANSWERS, chat.id, a.cut(answer))
+            msg = t.ANSWER_SENT
         else:  # if the student has refused to answer
             self.refused.append(username)
-            log_text, msg = log.REFUSES.format(chat.id), t.REFUSAL_SENT
+            log.cl.info(log.REFUSES, chat.id)
+            msg = t.REFUSAL_SENT
 
-        log.cl.info(log_text)
         bot.edit_message_text(msg[language], chat.id, message_id)
         del self.asked[chat.id]
 
-        usernames_answered = '\n\n'.join([f'{username}\n{answer}' for username, answer in self.answered])
+        usernames_answered = '\n\n'.join(self.answered)
         usernames_refused = '\n'.join(self.refused)
         usernames_asked = '\n'.join([r[0] for r in self.asked.values()])
 
@@ -2107,7 +1957,7 @@ class AskingGroup(Interaction):
                 bot.send_message(self.group_chat[0], text)
 
             del current[self.group_id]
-            log.cl.info(log.ALL_ANSWERED.format(self.group_id))
+            log.cl.info(log.ALL_ANSWERED, self.group_id)
 
         del current[chat.id]
 
@@ -2134,9 +1984,9 @@ class AskingGroup(Interaction):
         if not self.asked:  # if the second part of the interaction has not been launched
             super().respond(command, message)
         else:  # if the second part of the interaction has been launched
-            text = self.ONGOING_MESSAGE[self.asked[message.from_user.id][1]]
+            text = t.ONGOING_ANSWERING[self.asked[message.from_user.id][1]]
             message.reply_text(text, quote=message.chat.type != Chat.PRIVATE)
-            log.cl.info(log.INTERRUPTS.format(message.from_user.id, command, type(self).__name__))
+            log.cl.info(log.INTERRUPTS, message.from_user.id, command, type(self).__name__)
 
     def terminate(self):
         """
@@ -2156,17 +2006,20 @@ class AskingGroup(Interaction):
             del current[user_id]  # the student is no longer having the interaction
 
         del current[self.group_id]  # the group is no longer having the interaction
-        log.cl.info(log.TERMINATES.format(self.chat_id))
+        log.cl.info(log.TERMINATES, self.chat_id)
         self.send_message(t.GROUP_ASKING_TERMINATED[0][self.language])
 
 
 class ChangingLeader(Interaction):
     COMMAND, UNAVAILABLE_MESSAGE, IS_PRIVATE = 'resign', t.UNAVAILABLE_CHANGING_LEADER, True
     ONGOING_MESSAGE, ALREADY_MESSAGE = t.ONGOING_CHANGING_LEADER, t.ALREADY_CHANGING_LEADER
+    FAMILIARITY = a.Familiarity.resign
+    __slots__ = ('to_admin', 'candidate_records')
 
     def __init__(self, record: a.ChatRecord):
         super().__init__(record)
         self.to_admin = True  # whether the authorities will be given to an admin
+        self.candidate_records: list[tuple[int, str, int]] = None
 
         self.ask_polar((t.FT_ASK_RESIGN if not self.is_familiar else t.ASK_RESIGN)[self.language])
         self.next_action = self.handle_answer
@@ -2190,7 +2043,7 @@ class ChangingLeader(Interaction):
             return  # no response
 
         if not self.is_familiar:  # if the user is using /resign for the first time
-            self.update_familiarity(self.chat_id, self.familiarity, resign='1')
+            self.update_familiarity(self.chat_id, self.FAMILIARITY)
 
         if is_positive:
             self.ask_new_leader()
@@ -2204,9 +2057,10 @@ class ChangingLeader(Interaction):
         This method makes the bot ask the leader which of their groupmates their authorities will be given to. The
         options are the group's admins (or ordinary students) and are provided as inline buttons.
         """
-        candidates = [
-            [InlineKeyboardButton(username, callback_data=f'{user_id} {username} {language}')]
-            for user_id, username, language in self.get_candidate_records()
+        self.candidate_records = self.get_candidate_records()
+        candidates = [  # using indices, the chosen candidate's record is then taken from the ones that are kept
+            [InlineKeyboardButton(username, callback_data=str(index))]
+            for index, (_, username, _) in enumerate(self.candidate_records)
         ]
         markup = InlineKeyboardMarkup(candidates)
 
@@ -2221,29 +2075,16 @@ class ChangingLeader(Interaction):
             identifiers. Namely, list of tuples that contain the candidate's telegram id, username or other identifier,
             and language (its index according to src.bot.config.LANGUAGES).
         """
-        connection = connect(c.DATABASE)
-        cursor = connection.cursor()
-
-        cursor.execute(  # the group's admins
-            'SELECT id, username, language FROM chats '
-            'WHERE group_id = ? AND role = 1',
-            (self.group_id,)
-        )
-        candidate_records: list[tuple[int, str, int]] = cursor.fetchall()
+        related_records = a.get_related_chat_records(self.group_id)
+        # the group's admins
+        candidate_records = [(r.id, r.username, r.language) for r in related_records if r.role == c.ADMIN_ROLE]
 
         if not candidate_records:  # if the are no admins in the group
-            cursor.execute(  # the leader's groupmates
-                'SELECT id, username, language FROM chats '
-                'WHERE group_id = ? AND role = 0 AND type = 0',
-                (self.group_id,)
-            )
-            candidate_records: list[tuple[int, str, int]] = cursor.fetchall()
+            candidate_records = [  # the leader's groupmates
+                (r.id, r.username, r.language) for r in related_records if r.role == c.ORDINARY_ROLE
+            ]
             self.to_admin = False  # the authorities will be given to an ordinary student
 
-        cursor.close()
-        connection.close()
-
-        candidate_records.sort(key=lambda r: a.str_sort_key(r[1]))
         return candidate_records
 
     def change_leader(self, update: Update):
@@ -2261,29 +2102,25 @@ class ChangingLeader(Interaction):
         query = update.callback_query
 
         try:
-            new_leader = query.data.split()
+            new_leader_id, new_leader_username, new_leader_language = self.candidate_records[int(query.data)]
         except AttributeError:  # if the update is not caused by choosing a candidate
             return  # no response
 
         if not self.is_familiar:  # if the leader is giving away their authorities for the first time
-            self.update_familiarity(self.chat_id, self.familiarity, resign='1')
+            self.update_familiarity(self.chat_id, self.FAMILIARITY)
 
-        new_leader_id, new_leader_username, new_leader_language = int(new_leader[0]), new_leader[1], int(new_leader[2])
-
-        connection = connect(c.DATABASE)
-        cursor = connection.cursor()
-        cursor.execute(  # making the chosen groupmate the group's leader
-            'UPDATE chats SET role = 2 WHERE id = ?',
-            (new_leader_id,)
-        )
-        cursor.execute(  # making the leader an admin
-            'UPDATE chats SET role = 1 WHERE id = ?',
-            (self.chat_id,)
-        )
-        connection.commit()
-        cursor.close()
-        connection.close()
-        log.cl.info(log.NOW_LEADER.format(new_leader_id))
+        with a.database_cursor() as cursor:  # both roles are changed in one transaction
+            cursor.execute(  # making the chosen groupmate the group's leader
+                'UPDATE chats SET role = 2 WHERE id = ?',
+                (new_leader_id,)
+            )
+            cursor.execute(  # making the leader an admin
+                'UPDATE chats SET role = 1 WHERE id = ?',
+                (self.chat_id,)
+            )
+        a.forget_chat_record(new_leader_id)
+        a.forget_chat_record(self.chat_id)
+        log.cl.info(log.NOW_LEADER, new_leader_id)
 
         new_commands = '' if self.to_admin else t.ADMIN_COMMANDS[new_leader_language]
         new_commands += t.LEADER_COMMANDS[new_leader_language]
@@ -2295,6 +2132,8 @@ class ChangingLeader(Interaction):
 class SendingFeedback(Interaction):
     COMMAND, UNAVAILABLE_MESSAGE, IS_PRIVATE = 'feedback', None, True
     ONGOING_MESSAGE, ALREADY_MESSAGE = t.ONGOING_SENDING_FEEDBACK, t.ALREADY_SENDING_FEEDBACK
+    FAMILIARITY = a.Familiarity.feedback
+    __slots__ = ()
 
     def __init__(self, record: a.ChatRecord):
         super().__init__(record)
@@ -2312,27 +2151,25 @@ class SendingFeedback(Interaction):
         """
         now, new_feedback = datetime.now().strftime(log.TIME_FORMAT), update.effective_message.text
 
-        connection = connect(c.DATABASE)
-        cursor = connection.cursor()
-
         if not self.is_familiar:  # if the user is sending feedback for the first time
-            self.update_familiarity(self.chat_id, self.familiarity, feedback='1')
-            updated_feedback = f'{now}\n{new_feedback}'
-        else:  # if the user is sending feedback not for the first time
+            self.update_familiarity(self.chat_id, self.FAMILIARITY)
+
+        with a.database_cursor() as cursor:
+            if not self.is_familiar:  # if the user is sending feedback for the first time
+                updated_feedback = f'{now}\n{new_feedback}'
+            else:  # if the user is sending feedback not for the first time
+                cursor.execute(
+                    'SELECT feedback FROM chats WHERE id = ?',
+                    (self.chat_id,)
+                )
+                updated_feedback = cursor.fetchone()[0] + f'\n\n{now}\n{new_feedback}'
+
             cursor.execute(
-                'SELECT feedback FROM chats WHERE id = ?',
-                (self.chat_id,)
+                'UPDATE chats SET feedback = ? WHERE id = ?',
+                (updated_feedback, self.chat_id)
             )
-            updated_feedback = cursor.fetchone()[0] + f'\n\n{now}\n{new_feedback}'
-
-        cursor.execute(
-            'UPDATE chats SET feedback = ? WHERE id = ?',
-            (updated_feedback, self.chat_id)
-        )
-        connection.commit()
-        cursor.close()
-        connection.close
-        log.cl.info(log.SENDS_FEEDBACK.format(self.chat_id, a.cut(new_feedback)))
+        a.forget_chat_record(self.chat_id)
+        log.cl.info(log.SENDS_FEEDBACK, self.chat_id, a.cut(new_feedback))
 
         self.send_message(t.FEEDBACK_SENT[self.language])
         self.terminate()
@@ -2341,6 +2178,8 @@ class SendingFeedback(Interaction):
 class DeletingData(Interaction):
     COMMAND, IS_PRIVATE = 'leave', False
     ONGOING_MESSAGE, ALREADY_MESSAGE = t.ONGOING_DELETING_DATA, t.ALREADY_DELETING_DATA
+    FAMILIARITY = a.Familiarity.leave
+    __slots__ = ('is_last',)
 
     def __init__(self, record: a.ChatRecord, is_last: bool):
         super().__init__(record)
@@ -2366,13 +2205,13 @@ class DeletingData(Interaction):
             return  # no response
 
         if not self.is_familiar:  # if the user is using /leave for the first time
-            self.update_familiarity(self.chat_id, self.familiarity, leave='1')
+            self.update_familiarity(self.chat_id, self.FAMILIARITY)
 
         if is_positive:
             self.delete_record()
             query.message.edit_text(t.DATA_DELETED[self.language])
         else:
-            log.cl.info(log.STAYS.format(self.chat_id))
+            log.cl.info(log.STAYS, self.chat_id)
             query.message.edit_text(t.DATA_KEPT[self.language])
 
         self.terminate()
@@ -2383,32 +2222,33 @@ class DeletingData(Interaction):
         the user's record in the database. If the user is the last registered student from their group, its record and
         records of the group's group chats are also deleted.
         """
-        connection = connect(c.DATABASE)
-        cursor = connection.cursor()
-
-        if not self.is_last:  # if the chat is not the last registered one from the group
-            cursor.execute(  # deleting the user's record
-                'DELETE FROM chats WHERE id = ?',
-                (self.chat_id,)
-            )
-        else:  # if the user is the last registered student from the group
-            cursor.execute(  # deleting the user's record and records of the group's group chats
-                'DELETE FROM chats WHERE group_id = ?',
-                (self.group_id,)
-            )
-            cursor.execute(  # deleting the group's record
-                'DELETE FROM groups WHERE id = ?',
-                (self.group_id,)
-            )
-
-        connection.commit()
-        cursor.close()
-        connection.close()
-        log.cl.info(log.LEAVES.format(self.chat_id, self.group_id))
+        with a.database_cursor() as cursor:
+            if not self.is_last:  # if the chat is not the last registered one from the group
+                cursor.execute(  # deleting the user's record
+                    'DELETE FROM chats WHERE id = ?',
+                    (self.chat_id,)
+                )
+            else:  # if the user is the last registered student from the group
+                cursor.execute(  # deleting the user's record and records of the group's group chats
+                    'DELETE FROM chats WHERE group_id = ?',
+                    (self.group_id,)
+                )
+                cursor.execute(  # deleting the group's record
+                    'DELETE FROM groups WHERE id = ?',
+                    (self.group_id,)
+                )
+        if not self.is_last:
+            a.forget_chat_record(self.chat_id)
+        else:
+            a.forget_group_chat_records(self.group_id)
+            a.forget_group_data('events', self.group_id)
+            a.forget_group_data('info', self.group_id)
+        log.cl.info(log.LEAVES, self.chat_id)
         if self.is_last:
-            log.cl.info(log.LEAVES.format(self.group_id))
+            log.cl.info(log.LEAVES, self.group_id)
         else:
             a.update_group_chat_language(self.group_id)
 
 
 current: dict[int, Union[Interaction, EventAnswering]] = {}
+event_answerings: dict[int, EventAnswering] = {}  # by ids of groups whose students are asked about events
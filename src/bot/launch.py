@@ -1,56 +1,63 @@
 __author__ = 'Victor Serhiyovych Buhaiov'
 
-from datetime import datetime
-from threading import Thread
-from sqlite3 import connect
+from datetime import datetime, time
+from collections import Counter
 import logging
 
-from telegram.ext import CommandHandler, CallbackQueryHandler, MessageHandler, Filters, PollAnswerHandler
+from pytz import timezone
 
-from interactions import updater
+from telegram.ext import Updater, CommandHandler, CallbackQueryHandler, MessageHandler, Filters, PollAnswerHandler
+
+from interactions import bot
+from auxiliary import database_cursor
 import brain
 from managers import COMMANDS
-from config import THRESHOLD_DATE, DATABASE
+from config import THRESHOLD_DATE, NOTIFICATION_TIME, TIMEZONE
 import log
 
 logging.basicConfig(filename=log.BOT_LOG, filemode='w', format=log.BOT_LOG_FORMAT, datefmt=log.TIME_FORMAT,
                     level=logging.INFO)
 
+# ----------------------------------------------------------------------------------------------- migrating the database
+
+with database_cursor() as cursor:
+    cursor.execute(  # chats whose familiarity is still stored as a string of 15 digits
+        'SELECT id, familiarity FROM chats WHERE length(familiarity) = 15'
+    )
+    digits_records: list[tuple[int, str]] = cursor.fetchall()
+    cursor.executemany(  # storing familiarity as the bitmask of src.bot.auxiliary.Familiarity, the i-th digit is bit i
+        'UPDATE chats SET familiarity = ? WHERE id = ?',
+        [(int(digits[::-1], 2), chat_id) for chat_id, digits in digits_records]
+    )
+    cursor.execute(  # chats are mostly searched by their group and type
+        'CREATE INDEX IF NOT EXISTS chats_group_type ON chats (group_id, type)'
+    )
+
 # ------------------------------------------------------------------------------------------------ cleaning the database
 
 now = datetime.now()
 if now.month >= THRESHOLD_DATE[0] and now.day >= THRESHOLD_DATE[1]:
     graduation_year = now.year - 2000
 
-    connection = connect(DATABASE)
-    cursor = connection.cursor()
-
-    cursor.execute(  # ids of graduated groups and number of chats related to each one of them
-        'SELECT group_id, COUNT(id) FROM chats '
-        'WHERE group_id IN (SELECT id FROM groups WHERE graduation = ?)'
-        'GROUP BY group_id',
-        (graduation_year,)
-    )
-    graduated_groups: list[tuple[int, int]] = cursor.fetchall()
-    for group_id, num_chats in graduated_groups:
-        logging.info(log.GRADUATES.format(group_id, num_chats))
-
-    cursor.execute(  # deleting records of chats that are related to graduated groups
-        'DELETE FROM chats '
-        'WHERE group_id IN (SELECT id FROM groups WHERE graduation = ?)',
-        (graduation_year,)
-    )
-    cursor.execute(  # deleting records of graduated groups
-        'DELETE FROM groups WHERE graduation = ?',
-        (graduation_year,)
-    )
-
-    connection.commit()
-    cursor.close()
-    connection.close()
+    with database_cursor() as cursor:
+        cursor.execute(  # deleting records of chats that are related to graduated groups
+            'DELETE FROM chats '
+            'WHERE group_id IN (SELECT id FROM groups WHERE graduation = ?) '
+            'RETURNING group_id',
+            (graduation_year,)
+        )
+        graduated_groups = Counter(group_id for group_id, in cursor.fetchall())  # number of chats of each group
+        cursor.execute(  # deleting records of graduated groups
+            'DELETE FROM groups WHERE graduation = ?',
+            (graduation_year,)
+        )
+
+    for group_id, num_chats in graduated_groups.items():
+        logging.info(log.GRADUATES, group_id, num_chats)
 
 # ------------------------------------------------------------------------------------------------------------- handlers
 
+updater = Updater(bot=bot)  # the bot's connection pool is big enough for the updater's workers
 dispatcher = updater.dispatcher
 
 dispatcher.add_handler(CommandHandler(tuple(COMMANDS.keys()), brain.command_handler))
@@ -58,12 +65,15 @@ dispatcher.add_handler(CallbackQueryHandler(brain.callback_query_handler))
 dispatcher.add_handler(MessageHandler(Filters.text, brain.text_handler))
 dispatcher.add_handler(PollAnswerHandler(brain.poll_answer_handler))
 
-# ------------------------------------------------------------------------------- communication and notification threads
+# --------------------------------------------------------------------------------------- communication and notification
 
-communication_thread = Thread(target=updater.start_polling)
-notification_thread = Thread(target=brain.notification)
+# the zone, not the current offset, so that the job keeps to the local time after daylight saving time changes
+updater.job_queue.run_daily(brain.notification, time(*NOTIFICATION_TIME, tzinfo=timezone(TIMEZONE)))
+logging.info(log.NT_STARTS)
 
-communication_thread.start()
+updater.start_polling()  # polling and dispatching run in the updater's own threads
 logging.info(log.CT_STARTS)
-notification_thread.start()
-logging.info(log.NT_STARTS)
+updater.idle()
+
+with database_cursor() as cursor:
+    cursor.execute('PRAGMA optimize')  # updating statistics of the query planner once the bot has stopped
@@ -1,4 +1,7 @@
 import logging
+from logging.handlers import QueueHandler, QueueListener
+from queue import Queue
+import atexit
 
 BOT_LOG, BOT_LOG_FORMAT = '../../log/bot.log', '%(levelname)s | %(asctime)s.%(msecs)d | %(name)s | %(message)s'
 COMMUNICATION_LOG, NOTIFICATION_LOG = '../../log/communication.log', '../../log/notification.log'
@@ -6,7 +9,7 @@ LOG_FORMAT, TIME_FORMAT = '%(levelname)s | %(asctime)s | %(message)s', '%Y.%m.%d
 
 # ----------------------------------------------------------------------------------------------------------------- bot
 
-GRADUATES = '{} graduates, {} chats deleted'
+GRADUATES = '%s graduates, %s chats deleted'
 CT_STARTS, NT_STARTS = 'communication thread starts', 'notification thread starts'
 
 # ------------------------------------------------------------------------------------------------------- communication
@@ -14,55 +17,60 @@ CT_STARTS, NT_STARTS = 'communication thread starts', 'notification thread start
 cl = logging.getLogger('communication')  # communication logger
 file_handler = logging.FileHandler(COMMUNICATION_LOG, 'w', 'utf8')
 file_handler.setFormatter(logging.Formatter(LOG_FORMAT, TIME_FORMAT))
-cl.addHandler(file_handler)
+cl_queue = Queue()  # records are written to the file by the listener's thread, not by the one handling updates
+cl.addHandler(QueueHandler(cl_queue))
 cl.setLevel(logging.DEBUG)
-
-UNAVAILABLE_COMMAND = '{} uses /{} with role {}'
-STARTS_NOT_PRIVATELY = '{} is invited to continue {} privately'
-STARTS, ENDS, INTERRUPTS = '{} starts {}', '{} ends {}', '{} uses /{} during {}'
-BECOMES_FAMILIAR = '{} becomes familiar with "{}" interaction'
-
-START_BEING_REGISTERED, REGISTERS = '{} uses /start being registered', '{} registers as from {}'
-GROUP_LANGUAGE_UPDATED = 'language of {} is now {}, spoken by {}'
-LEAVE_NOT_PRIVATELY, LEAVES, STAYS = '{} uses /leave in non-private {}', '{} leaves', '{} refuses to leave'
-
-COMMANDS = '{} displays commands'
-
-CLAIM_BEING_LEADER, CLAIM_WITH_LEADER = '{} uses /claim being a leader', "{} uses /claim when the group has a leader"
-CLAIM_WITHOUT_ENOUGH, CLAIM_WITHOUT_CHAT = '{} uses /claim with {} groupmates', '{} uses /claim without a group chat'
-CLAIMS_LATE = '{} uses /claim when {} is being confirmed'
-CONFIRMED, NOT_CONFIRMED = '{} is confirmed to be the leader', '{} is confirmed not to be the leader'
-ENTERS_EDU_YEAR = '{} enters the EDU year: {}/{}'
-
-TRUST_OVER_LIMIT = '{} uses /trust when {}/{} in the group are admins'
-TRUST_ALONE = '{} attempts to add an admin being alone'
-NOW_ADMIN = '{} is made an admin'
-DISTRUST_WITHOUT_ADMINS = '{} attempts to remove an admin without admins'
-NO_MORE_ADMIN, FORMER_NOTIFIED = '{} is no more an admin', '{} is notified that they are no more an admin'
-
-INVOLVING_GROUP_ALONE = '{} uses /{} alone'
-NOW_LEADER = "{} is made the leader"
-
-ADDS, ASKED_EVENT = '{} adds "{}"', 'students of {} are asked about "{}"'
-ADDS_DUPLICATE = '{} attempts to add a duplicate of "{}"'
-AGREES, DISAGREES = '{} agrees to be notified about "{}"', '{} disagrees to be notified about "{}"'
-AGREES_LATE = '{} agrees to be notified about "{}" after it has passed'
-DISAGREES_LATE = '{} disagrees to be notified about "{}" after it has passed'
-ALL_ANSWERED_EVENT = 'all students of {} have answered concerning reminding about "{}"'
-CANCEL_WITHOUT_EVENTS, CANCELS = '{} uses /cancel without events', '{} cancels "{}"'
-
-SAVES, CLEARS, KEEPS = '{} saves "{}"', "{} clears info", "{} refuses to clear info"
-DELETE_WITHOUT_INFO, DELETES = "{} uses /{} without info", '{} deletes "{}"'
-
-NOTIFIED = 'students of {} are notified about "{}"'
-MAKES_PUBLIC, MAKES_NON_PUBLIC = '{} makes the answers public', '{} makes the answers non-public'
-ASKED = 'students of {} are asked "{}"'
-ANSWERS, REFUSES = '{} answers with "{}"', '{} refuses to answer'
-ALL_ANSWERED, TERMINATES = 'all students of {} have answered', '{} terminates asking'
-
-SENDS_FEEDBACK = '{} sends feedback "{}"'
-
-INFO, EVENTS = '{} displays info', '{} displays events'
+cl_listener = QueueListener(cl_queue, file_handler)
+cl_listener.start()
+atexit.register(cl_listener.stop)  # writing the remaining records
+
+# messages are formatted by the loggers with the arguments of the logging calls, only if the records are written
+UNAVAILABLE_COMMAND = '%s uses /%s with role %s'
+STARTS_NOT_PRIVATELY = '%s is invited to continue %s privately'
+STARTS, ENDS, INTERRUPTS = '%s starts %s', '%s ends %s', '%s uses /%s during %s'
+BECOMES_FAMILIAR = '%s becomes familiar with "%s" interaction'
+
+START_BEING_REGISTERED, REGISTERS = '%s uses /start being registered', '%s registers as from %s'
+GROUP_LANGUAGE_UPDATED = 'language of %s is now %s, spoken by %s'
+LEAVE_NOT_PRIVATELY, LEAVES, STAYS = '%s uses /leave in non-private %s', '%s leaves', '%s refuses to leave'
+
+COMMANDS = '%s displays commands'
+
+CLAIM_BEING_LEADER, CLAIM_WITH_LEADER = '%s uses /claim being a leader', "%s uses /claim when the group has a leader"
+CLAIM_WITHOUT_ENOUGH, CLAIM_WITHOUT_CHAT = '%s uses /claim with %s groupmates', '%s uses /claim without a group chat'
+CLAIMS_LATE = '%s uses /claim when %s is being confirmed'
+CONFIRMED, NOT_CONFIRMED = '%s is confirmed to be the leader', '%s is confirmed not to be the leader'
+ENTERS_EDU_YEAR = '%s enters the EDU year: %s/%s'
+
+TRUST_OVER_LIMIT = '%s uses /trust when %s/%s in the group are admins'
+TRUST_ALONE = '%s attempts to add an admin being alone'
+NOW_ADMIN = '%s is made an admin'
+DISTRUST_WITHOUT_ADMINS = '%s attempts to remove an admin without admins'
+NO_MORE_ADMIN, FORMER_NOTIFIED = '%s is no more an admin', '%s is notified that they are no more an admin'
+
+INVOLVING_GROUP_ALONE = '%s uses /%s alone'
+NOW_LEADER = "%s is made the leader"
+
+ADDS, ASKED_EVENT = '%s adds "%s"', 'students of %s are asked about "%s"'
+ADDS_DUPLICATE = '%s attempts to add a duplicate of "%s"'
+AGREES, DISAGREES = '%s agrees to be notified about "%s"', '%s disagrees to be notified about "%s"'
+AGREES_LATE = '%s agrees to be notified about "%s" after it has passed'
+DISAGREES_LATE = '%s disagrees to be notified about "%s" after it has passed'
+ALL_ANSWERED_EVENT = 'all students of %s have answered concerning reminding about "%s"'
+CANCEL_WITHOUT_EVENTS, CANCELS = '%s uses /cancel without events', '%s cancels "%s"'
+
+SAVES, CLEARS, KEEPS = '%s saves "%s"', "%s clears info", "%s refuses to clear info"
+DELETE_WITHOUT_INFO, DELETES = "%s uses /%s without info", '%s deletes "%s"'
+
+NOTIFIED = 'students of %s are notified about "%s"'
+MAKES_PUBLIC, MAKES_NON_PUBLIC = '%s makes the answers public', '%s makes the answers non-public'
+ASKED = 'students of %s are asked "%s"'
+ANSWERS, REFUSES = '%s answers with "%s"', '%s refuses to answer'
+ALL_ANSWERED, TERMINATES = 'all students of %s have answered', '%s terminates asking'
+
+SENDS_FEEDBACK = '%s sends feedback "%s"'
+
+INFO, EVENTS = '%s displays info', '%s displays events'
 
 # -------------------------------------------------------------------------------------------------------- notification
 
@@ -73,8 +81,9 @@ nl.addHandler(file_handler)
 nl.setLevel(logging.DEBUG)
 
 REMINDING_STARTS = 'reminding starts'
-GROUP_REMINDED = '{} student(s) from {} reminded about {} event(s)'
+GROUP_REMINDED = '%s student(s) from %s reminded about %s event(s)'
 REMINDING_FINISHES = 'reminding finishes'
 
 ECAMPUS_NOTIFICATION_STARTS = 'e-campus notification starts'
+ECAMPUS_CHECK_FAILS = 'e-campus account of %s cannot be checked'
 ECAMPUS_NOTIFICATION_FINISHES = 'e-campus notification finishes'
@@ -1,11 +1,10 @@
 from datetime import datetime, timedelta
-from collections import namedtuple
-from sqlite3 import connect
+from typing import NamedTuple, Callable, Union
 
 from telegram import Update, Chat, Message
 
 import interactions as i
-from auxiliary import ChatRecord, get_chat_record
+from auxiliary import ChatRecord, get_chat_record, get_related_chat_records, read_group_data
 import text as t
 from bot_info import USERNAME
 import config as c
@@ -30,7 +29,7 @@ def registration(chat: Chat, is_private: bool, message: Message):
             i.current[chat.id].respond(i.Registration.COMMAND, message)
     else:  # if the chat is already registered
         message.reply_text(t.ALREADY_REGISTERED[is_private][record.language], quote=not is_private)
-        l.cl.info(l.START_BEING_REGISTERED.format(chat.id))
+        l.cl.info(l.START_BEING_REGISTERED, chat.id)
 
 
 def leader_confirmation(record: ChatRecord, update: Update):
@@ -46,31 +45,17 @@ def leader_confirmation(record: ChatRecord, update: Update):
 
     if record.role == c.LEADER_ROLE:  # is the user is already a leader
         message.reply_text(t.ALREADY_LEADER[record.language], quote=not is_private)
-        l.cl.info(l.CLAIM_BEING_LEADER.format(record.id))
+        l.cl.info(l.CLAIM_BEING_LEADER, record.id)
         return
 
-    connection = connect(c.DATABASE)
-    cursor = connection.cursor()
-
-    cursor.execute(  # record of the leader of the user's group
-        'SELECT id FROM chats WHERE group_id = ? AND role = 2',
-        (record.group_id,)
-    )
-    leader = cursor.fetchone()
+    group_records = get_related_chat_records(record.group_id)  # everything below is found among them
+    leader = any(r.role == c.LEADER_ROLE for r in group_records)
+    # record of the group's first registered group chat
+    group_chat_record = min(((r.id, r.language) for r in group_records if r.type), default=None)
+    num_groupmates = sum(not r.type for r in group_records) - 1
 
     if not leader:  # if there is no leader in the group
-        cursor.execute(  # record of the group's first registered group chat
-            'SELECT id, language FROM chats WHERE group_id = ? AND type <> 0',
-            (record.group_id,)
-        )
-        group_chat_record = cursor.fetchone()
-
         if group_chat_record:  # if the group has registered a group chat
-            cursor.execute(  # number of registered students from the group
-                'SELECT COUNT(id) FROM chats WHERE group_id = ? AND type = 0',
-                (record.group_id,)
-            )
-            num_groupmates = cursor.fetchone()[0] - 1
 
             # if many enough students in the group are registered
             if num_groupmates >= c.MIN_GROUPMATES_FOR_LC:
@@ -83,7 +68,7 @@ def leader_confirmation(record: ChatRecord, update: Update):
                     interaction: i.LeaderConfirmation = i.current[record.group_id]
 
                     if not interaction.is_candidate(record.id):  # if the user is the candidate's groupmate
-                        l.cl.info(l.CLAIMS_LATE.format(record.id, interaction.chat_id))
+                        l.cl.info(l.CLAIMS_LATE, record.id, interaction.chat_id)
                         interaction.add_claimer(record.id, record.language)
                         text = t.ONGOING_LC[record.language].format(interaction.username)
                         message.reply_text(text, quote=not is_private)
@@ -94,18 +79,15 @@ def leader_confirmation(record: ChatRecord, update: Update):
                 difference = c.MIN_GROUPMATES_FOR_LC - num_groupmates
                 text = t.NOT_ENOUGH_FOR_LC[record.language].format(num_groupmates, difference)
                 message.reply_text(text, quote=not is_private)
-                l.cl.info(l.CLAIM_WITHOUT_ENOUGH.format(record.id, num_groupmates))
+                l.cl.info(l.CLAIM_WITHOUT_ENOUGH, record.id, num_groupmates)
 
         else:  # if the group has not registered a group chat
             message.reply_text(t.GROUP_CHAT_NEEDED[record.language], quote=not is_private)
-            l.cl.info(l.CLAIM_WITHOUT_CHAT.format(record.id))
+            l.cl.info(l.CLAIM_WITHOUT_CHAT, record.id)
 
     else:  # if there is already a leader in the group
         message.reply_text(t.ALREADY_LEADER_IN_GROUP[record.language], quote=not is_private)
-        l.cl.info(l.CLAIM_WITH_LEADER.format(record.id))
-
-    cursor.close()
-    connection.close()
+        l.cl.info(l.CLAIM_WITH_LEADER, record.id)
 
 
 def adding_admin(record: ChatRecord, update: Update):
@@ -121,32 +103,18 @@ def adding_admin(record: ChatRecord, update: Update):
     chat, message = update.effective_chat, update.effective_message
     is_private = chat.type == Chat.PRIVATE
 
-    connection = connect(c.DATABASE)
-    cursor = connection.cursor()
-
-    cursor.execute(  # records of admins from the leader's group
-        'SELECT COUNT(id) FROM chats WHERE group_id = ? AND role = 1',
-        (record.group_id,)
-    )
-    num_admins = cursor.fetchone()[0]
-
-    cursor.execute(  # records of students from the leader's group
-        'SELECT COUNT(id) FROM chats WHERE group_id = ? AND type = 0',
-        (record.group_id,)
-    )
-    num_students = cursor.fetchone()[0]
-
-    cursor.close()
-    connection.close()
+    group_records = get_related_chat_records(record.group_id)
+    num_admins = sum(r.role == c.ADMIN_ROLE for r in group_records)  # admins from the leader's group
+    num_students = sum(not r.type for r in group_records)  # students from the leader's group
 
     if (num_admins + 1) / num_students <= c.MAX_ADMINS_STUDENTS_RATIO:  # if adding an admin will not exceed the limit
         attempt_interaction(COMMANDS[i.AddingAdmin.COMMAND], record, chat, is_private, message)
     elif num_students > 1:  # if adding 1 more admin will exceed the limit
         message.reply_text(t.ADMIN_LIMIT_REACHED[record.language], quote=not is_private)
-        l.cl.info(l.TRUST_OVER_LIMIT.format(record.id, num_admins, num_students))
+        l.cl.info(l.TRUST_OVER_LIMIT, record.id, num_admins, num_students)
     else:  # if the leader is the only registered student from the group
         message.reply_text(t.NO_GROUPMATES_TO_TRUST[record.language], quote=not is_private)
-        l.cl.info(l.TRUST_ALONE.format(record.id, record.group_id))
+        l.cl.info(l.TRUST_ALONE, record.id)
 
 
 def removing_admin(record: ChatRecord, update: Update):
@@ -161,21 +129,14 @@ def removing_admin(record: ChatRecord, update: Update):
     chat, message = update.effective_chat, update.effective_message
     is_private = chat.type == Chat.PRIVATE
 
-    connection = connect(c.DATABASE)
-    cursor = connection.cursor()
-    cursor.execute(  # records of admins from the leader's group
-        'SELECT COUNT(id) FROM chats WHERE group_id = ? AND role = 1',
-        (record.group_id,)
-    )
-    num_admins = cursor.fetchone()[0]
-    cursor.close()
-    connection.close()
+    # admins from the leader's group
+    num_admins = sum(r.role == c.ADMIN_ROLE for r in get_related_chat_records(record.group_id))
 
     if num_admins:  # if there are admins in the group
         attempt_interaction(COMMANDS[i.RemovingAdmin.COMMAND], record, chat, is_private, message)
     else:  # if there are no admins in the group
         message.reply_text(t.ALREADY_NO_ADMINS[record.language], quote=not is_private)
-        l.cl.info(l.DISTRUST_WITHOUT_ADMINS.format(record.id, record.group_id))
+        l.cl.info(l.DISTRUST_WITHOUT_ADMINS, record.id)
 
 
 def connecting_ecampus(record: ChatRecord, update: Update):
@@ -205,23 +166,13 @@ def canceling_event(record: ChatRecord, update: Update):
     Args: see src.bot.managers.deleting_data.__doc__.
     """
     chat, message = update.effective_chat, update.effective_message
-    is_private = chat.type = Chat.PRIVATE
-
-    connection = connect(c.DATABASE)
-    cursor = connection.cursor()
-    cursor.execute(
-        'SELECT events FROM groups WHERE id = ?',
-        (record.group_id,)
-    )
-    events = cursor.fetchone()[0]
-    cursor.close()
-    connection.close()
-
-    if events:
+    is_private = chat.type == Chat.PRIVATE
+
+    if events := read_group_data('events', record.group_id):
         attempt_interaction(COMMANDS[i.CancelingEvent.COMMAND], record, chat, is_private, message, events)
     else:
         message.reply_text(t.ALREADY_NO_EVENTS[record.language], quote=not is_private)
-        l.cl.info(l.CANCEL_WITHOUT_EVENTS.format(record.id))
+        l.cl.info(l.CANCEL_WITHOUT_EVENTS, record.id)
 
 
 def saving_info(record: ChatRecord, update: Update):
@@ -248,19 +199,9 @@ def deleting_info(record: ChatRecord, update: Update):
     Args: see src.bot.managers.deleting_data.__doc__.
     """
     chat, message = update.effective_chat, update.effective_message
-    is_private, command = chat.type == Chat.PRIVATE, message.text[1:].removesuffix(USERNAME).lower()
-
-    connection = connect(c.DATABASE)
-    cursor = connection.cursor()
-    cursor.execute(
-        'SELECT info FROM groups WHERE id = ?',
-        (record.group_id,)
-    )
-    info = cursor.fetchone()[0]
-    cursor.close()
-    connection.close()
-
-    if info:
+    is_private, command = chat.type == Chat.PRIVATE, command_of(message.text)
+
+    if info := read_group_data('info', record.group_id):
         args = [COMMANDS[command], record, chat, is_private, message]
         if command == i.DeletingInfo.COMMAND:
             args.append(info)
@@ -269,7 +210,7 @@ def deleting_info(record: ChatRecord, update: Update):
 
     else:
         message.reply_text(t.ALREADY_NO_INFO[record.language], quote=not is_private)
-        l.cl.info(l.DELETE_WITHOUT_INFO.format(record.id, command))
+        l.cl.info(l.DELETE_WITHOUT_INFO, record.id, command)
 
 
 def leader_involving_group(record: ChatRecord, update: Update):
@@ -282,18 +223,10 @@ def leader_involving_group(record: ChatRecord, update: Update):
     Args: see src.bot.managers.deleting_data.__doc__.
     """
     chat, message = update.effective_chat, update.effective_message
-    is_private, command = chat.type == Chat.PRIVATE, message.text[1:].removesuffix(USERNAME).lower()
+    is_private, command = chat.type == Chat.PRIVATE, command_of(message.text)
     is_communicative = command != i.ChangingLeader.COMMAND  # whether the command is /tell or /ask
 
-    connection = connect(c.DATABASE)
-    cursor = connection.cursor()
-    cursor.execute(  # records of admins from the leader's group
-        'SELECT COUNT(id) FROM chats WHERE group_id = ? AND type = 0',
-        (record.group_id,)
-    )
-    num_groupmates = cursor.fetchone()[0] - 1  # w/o the leader
-    cursor.close()
-    connection.close()
+    num_groupmates = sum(not r.type for r in get_related_chat_records(record.group_id)) - 1  # w/o the leader
 
     if num_groupmates:  # if the leader is not the only registered one from the group
 
@@ -305,7 +238,7 @@ def leader_involving_group(record: ChatRecord, update: Update):
             message.reply_text(t.ONGOING_GROUP_ANSWERING[record.language], quote=not is_private)
 
     else:  # if the leader is the only registered one from the group
-        l.cl.info(l.INVOLVING_GROUP_ALONE.format(record.id, command))
+        l.cl.info(l.INVOLVING_GROUP_ALONE, record.id, command)
 
         if is_communicative:  # if the command is /tell or /ask
             msg = t.NO_GROUPMATES_TO_NOTIFY if command == i.NotifyingGroup.COMMAND else t.NO_GROUPMATES_TO_ASK
@@ -341,17 +274,8 @@ def deleting_data(record: ChatRecord, update: Update):
     chat = update.effective_chat
 
     if chat.type == Chat.PRIVATE:  # if the chat is private
-        connection = connect(c.DATABASE)
-        cursor = connection.cursor()
-        cursor.execute(  # number of registered students from the group
-            'SELECT COUNT(id) FROM chats '
-            'WHERE group_id = ? AND type = 0',
-            (record.group_id,)
-        )
-        is_last = cursor.fetchone()[0] == 1
-        cursor.close()
-        connection.close()
-        print(is_last)
+        # if the student is the only registered one from the group
+        is_last = sum(not r.type for r in get_related_chat_records(record.group_id)) == 1
 
         # if the student is not the last registered one from the group or they are not the group's leader
         if is_last or record.role != c.LEADER_ROLE:
@@ -362,10 +286,16 @@ def deleting_data(record: ChatRecord, update: Update):
     else:  # if the chat is not private
         text = t.DELETING_DATA_IN_GROUPS[record.language]
         chat.send_message(text, reply_to_message_id=update.effective_message.message_id)
-        l.cl.info(l.LEAVE_NOT_PRIVATELY.format(record.id, chat.id))
+        l.cl.info(l.LEAVE_NOT_PRIVATELY, record.id, chat.id)
 
 
-Command = namedtuple('Command', ('manager', 'role', 'interaction'))
+class Command(NamedTuple):
+    manager: Callable  # function that decides whether the interaction will be started
+    role: int  # minimal role that the command is available for
+    interaction: Union[type, None]  # interaction that the command starts, None if it is displaying
+
+
+MENTION, MENTION_LENGTH = USERNAME.lower(), len(USERNAME)  # the bot's mention that can follow a command
 COMMANDS = {
     'start': Command(registration, c.ORDINARY_ROLE, i.Registration),
     'claim': Command(leader_confirmation, c.ORDINARY_ROLE, i.LeaderConfirmation),
@@ -388,6 +318,17 @@ COMMANDS = {
 }
 
 
+def command_of(text: str) -> str:
+    """
+    Args:
+        text (str): text of the message that a command is sent in.
+
+    Returns (str): the command in lowercase, without '/' and possible mention of the bot.
+    """
+    text = text.lower()
+    return text[1:-MENTION_LENGTH] if text.endswith(MENTION) else text[1:]
+
+
 def attempt_interaction(command: Command, record: ChatRecord, chat: Chat, is_private: bool, message: Message,
                         *args):
     """
@@ -412,7 +353,7 @@ def attempt_interaction(command: Command, record: ChatRecord, chat: Chat, is_pri
             # if the interaction is private but the chat is not
             if command.interaction.IS_PRIVATE and not is_private:
                 chat.send_message(t.PRIVATE_INTERACTION[record.language], reply_to_message_id=message.message_id)
-                l.cl.info(l.STARTS_NOT_PRIVATELY.format(record.id, command.interaction.__name__))
+                l.cl.info(l.STARTS_NOT_PRIVATELY, record.id, command.interaction.__name__)
 
             command.interaction(record, *args)
 
@@ -422,4 +363,4 @@ def attempt_interaction(command: Command, record: ChatRecord, chat: Chat, is_pri
     else:  # if the command is an admin one and the user is not an admin
         text = command.interaction.UNAVAILABLE_MESSAGE[record.language]
         chat.send_message(text, reply_to_message_id=None if is_private else message.message_id)
-        l.cl.info(l.UNAVAILABLE_COMMAND.format(record.id, command.interaction.COMMAND, record.role))
+        l.cl.info(l.UNAVAILABLE_COMMAND, record.id, command.interaction.COMMAND, record.role)
@@ -1,8 +1,9 @@
 from datetime import datetime
-from collections import namedtuple
-from itertools import cycle
+from typing import NamedTuple
+from itertools import cycle, groupby
+from operator import itemgetter
 from threading import Thread
-from sqlite3 import connect
+from concurrent.futures import Future
 
 from telegram import ParseMode
 from selenium import webdriver
@@ -10,18 +11,22 @@ from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions
-from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium.webdriver.remote.webelement import WebElement
 
-from interactions import bot, EventAnswering, current
-from auxiliary import str_to_datetime
+from interactions import bot, sending_pool, send_limited, EventAnswering, event_answerings
+from auxiliary import ZERO, str_to_datetime, database_cursor, reading_cursor, forget_group_data
 import text as t
 import config as c
 import log
 
 # ----------------------------------------------------------------------------------------------- reminding about events
 
-Event = namedtuple('Event', ('translated', 'reminded'))
+class Event(NamedTuple):
+    translated: list[str]  # the event in each language
+    reminded: frozenset[int]  # ids of students that have agreed to be reminded, a set as checking it is frequent
+
+
 EventsDict = dict[int, list[Event]]
 
 
@@ -31,75 +36,78 @@ def remind_about_events():
     now = datetime.now()
     today = datetime(now.year, now.month, now.day, 0, 0)
 
-    connection = connect(c.DATABASE)
-    cursor = connection.cursor()
-
-    cursor.execute('SELECT id, events FROM groups')
-    for group_id, events_str in cursor.fetchall():
-        try:
-            events_str = events_str.split('\n')
-        except AttributeError:  # if the group has no events
-            continue
-
-        cursor.execute(  # the group's students
-            'SELECT id, language FROM chats WHERE group_id = ? AND type = 0',
-            (group_id,)
+    with reading_cursor() as cursor:
+        cursor.execute(  # groups that have events, each with its students
+            'SELECT groups.id, events, chats.id, language FROM groups '
+            'LEFT JOIN chats ON group_id = groups.id AND type = 0 '
+            'WHERE events IS NOT NULL ORDER BY groups.id'
         )
-        student_records: list[tuple[int, int]] = cursor.fetchall()
+        records: list[tuple[int, str, int, int]] = cursor.fetchall()
+
+    # each with the events that were read, so that events changed meanwhile (e.g. added) are not overwritten
+    events_updates: list[tuple[str, int, str]] = []  # events of groups that have events that have not passed
+    events_clears: list[tuple[int, str]] = []  # groups all of whose events have passed
+    sendings: list[Future] = []  # reminders of groups that are being sent while the next groups are inspected
 
-        event_answering = None
-        for user_id, language in student_records:
-            if user_id in current and isinstance(current[user_id], EventAnswering):
-                event_answering = current[user_id]
-                break
+    for group_id, group_records in groupby(records, key=itemgetter(0)):
+        group_records = list(group_records)
+        stored_events = group_records[0][1]
+        events_str = stored_events.split('\n')
+        student_records = [(r[2], r[3]) for r in group_records if r[2] is not None]
 
-        events, reminded = inspect_events(events_str, today, event_answering)
+        events, reminded = inspect_events(events_str, today, event_answerings.get(group_id))
 
-        reminded_records = [r for r in student_records if str(r[0]) in reminded]
-        send_reminders(events, reminded_records)
+        reminded_records = [r for r in student_records if r[0] in reminded]
+        sendings.append(sending_pool.submit(send_reminders, events, reminded_records))
 
         if events_str:  # if there are events that have not passed
-            cursor.execute(  # updating the group's events, excluding ones that have passed
-                'UPDATE groups SET events = ? WHERE id = ?',
-                ('\n'.join(events_str), group_id)
-            )
+            events_updates.append(('\n'.join(events_str), group_id, stored_events))
         else:  # if all of the group's events have passed
-            cursor.execute(
-                'UPDATE groups SET events = NULL WHERE id = ?',
-                (group_id,)
-            )
-        connection.commit()
+            events_clears.append((group_id, stored_events))
 
         num_events = sum([len(days_left_events) for days_left_events in events.values()])
-        log.nl.info(log.GROUP_REMINDED.format(len(reminded_records), group_id, num_events))
+        log.nl.info(log.GROUP_REMINDED, len(reminded_records), group_id, num_events)
+
+    with database_cursor() as cursor:
+        # updating the groups' events, excluding ones that have passed, unless they have been changed meanwhile
+        cursor.executemany(
+            'UPDATE groups SET events = ? WHERE id = ? AND events = ?',
+            events_updates
+        )
+        cursor.executemany(
+            'UPDATE groups SET events = NULL WHERE id = ? AND events = ?',
+            events_clears
+        )
+    forget_group_data('events')
 
-    cursor.close()
-    connection.close()
+    for sending in sendings:
+        sending.result()  # waiting for the reminders to be sent, an exception raised while sending is raised here
 
     log.nl.info(log.REMINDING_FINISHES)
 
 
 def inspect_events(events_str: list[str], today: datetime, event_answering: EventAnswering) \
-        -> tuple[dict[int, list[Event]], set[str]]:
+        -> tuple[dict[int, list[Event]], set[int]]:
     events: EventsDict = {}
-    reminded = set[str]()
+    reminded = set[int]()
+    kept_events_str: list[str] = []  # the group's events, excluding ones that have passed
 
-    for event_str in events_str:  # for each of the group's events
-        event_str, _, event_reminded = event_str.rpartition('|')
-        event, event_reminded = str_to_datetime(event_str), event_reminded.split()
-
-        if not event_reminded:  # if no one has agreed to be reminded about the event
-            continue
+    for full_event_str in events_str:  # for each of the group's events
+        event_str, _, event_reminded = full_event_str.rpartition('|')
+        event, event_reminded = str_to_datetime(event_str, today), frozenset(map(int, event_reminded.split()))
 
         if event < today:  # if the event has passed
-            del events_str[0]
             if event_answering:
                 event_answering.cancel_question(event_str)
             continue
 
-        translated_event = [
-            f'{t.WEEKDAYS[int(event_str[0])][index]} {event_str[2:]}' for index in range(len(c.LANGUAGES))
-        ]
+        kept_events_str.append(full_event_str)
+
+        if not event_reminded:  # if no one has agreed to be reminded about the event
+            continue
+
+        date_time = event_str[2:]  # the event without its weekday, which is translated
+        translated_event = [f'{weekday} {date_time}' for weekday in t.WEEKDAYS[ord(event_str[0]) - ZERO]]
 
         if (days_left := (event - today).days) not in events:
             events[days_left] = [Event(translated_event, event_reminded)]
@@ -108,6 +116,7 @@ def inspect_events(events_str: list[str], today: datetime, event_answering: Even
 
         reminded.update(event_reminded)
 
+    events_str[:] = kept_events_str
     return events, reminded
 
 
@@ -117,14 +126,14 @@ def send_reminders(events: EventsDict, reminded_records: tuple[tuple[int, int]])
         user_events: dict[int, list[str]] = {}
         for days_left, days_left_events in events.items():
             days_left_user_events = [
-                event.translated[language] for event in days_left_events if str(user_id) in event.reminded
+                event.translated[language] for event in days_left_events if user_id in event.reminded
             ]
 
             # if the student has agreed to be reminded about at least 1 event that is days_left days
             if days_left_user_events:
                 user_events[days_left] = days_left_user_events
 
-        bot.send_message(user_id, t.report_on_events(user_events, language), ParseMode.HTML)
+        send_limited(user_id, t.report_on_events(user_events, language), ParseMode.HTML)
 
 
 # ---------------------------------------------------------------------------------- notification about e-campus changes
@@ -133,6 +142,12 @@ ECampusRecord = tuple[int, int, str, str, str]
 ECampusUpdate = tuple[int, list[str], list[str], list[float], list[str]]
 ECampusUpdatesDict = dict[int, ECampusUpdate]
 
+ABBREVIATION_IGNORED_WORDS = frozenset(('та', 'і', 'й', 'до', 'за'))  # conjunctions and prepositions of subject names
+
+chrome_options = webdriver.ChromeOptions()  # the browser is not displayed and does not load images
+for argument in ('--headless=new', '--disable-gpu', '--blink-settings=imagesEnabled=false'):
+    chrome_options.add_argument(argument)
+
 
 def check_ecampus_updates():
     log.nl.info(log.ECAMPUS_NOTIFICATION_STARTS)
@@ -140,14 +155,12 @@ def check_ecampus_updates():
     now = datetime.now()
     options = -4, -1 - (now.month >= c.THRESHOLD_DATE[0] and now.day >= c.THRESHOLD_DATE[1])
 
-    connection = connect(c.DATABASE)
-    cursor = connection.cursor()
-
-    cursor.execute(
-        'SELECT ecampus.id, language, login, password, points FROM ecampus, chats '
-        'GROUP BY ecampus.id'
-    )
-    ecampus_records: list[ECampusRecord] = cursor.fetchall()
+    with reading_cursor() as cursor:
+        cursor.execute(
+            'SELECT ecampus.id, language, login, password, points FROM ecampus, chats '
+            'GROUP BY ecampus.id'
+        )
+        ecampus_records: list[ECampusRecord] = cursor.fetchall()
 
     range_threads = range(c.ECAMPUS_THREADS)
     groups = [[] for _ in range_threads]
@@ -168,48 +181,61 @@ def check_ecampus_updates():
     for thread in group_threads:
         thread.join()
 
-    for user_id, (language, subjects, points, changes, new) in updates.items():
-        updated_points = '\n'.join([f'{s} {p}' for s, p in zip(subjects + new, points)])
-        cursor.execute(  # updating the student's points
+    points_updates = [
+        ('\n'.join([f'{s} {p}' for s, p in zip(subjects + new, points)]), user_id)
+        for user_id, (language, subjects, points, changes, new) in updates.items()
+    ]
+    with database_cursor() as cursor:
+        cursor.executemany(  # updating the students' points
             'UPDATE ecampus SET points = ? WHERE id = ?',
-            (updated_points, user_id)
+            points_updates
         )
 
+    for user_id, (language, subjects, points, changes, new) in updates.items():
         text = t.report_on_updates(subjects, points, changes, new, language)
         bot.send_message(user_id, text, ParseMode.HTML)
 
-    connection.commit()
-    cursor.close()
-    connection.close()
-
     log.nl.info(log.ECAMPUS_NOTIFICATION_FINISHES)
 
 
 def get_group_updates(group: list[ECampusRecord], options: tuple[int, int], updates: ECampusUpdatesDict):
-    for user_id, language, login, password, points_str in group:
-        subjects: list[str] = []
-        points: list[str] = []
-
-        try:
-            subjects_points = points_str.split('\n')
-        except AttributeError:  # if the student's account has never been checked
-            pass
-        else:  # if the student's account has been checked at least once
-            for subject_points in subjects_points:
-                s, _, p = subject_points.partition(' ')
-                subjects.append(s)
-                points.append(p)
-
-        try:
-            updates[user_id] = (language, subjects, *check_account_updates(login, password, options, points))
-        except TimeoutException:
-            bot.send_message(user_id, t.ECAMPUS_DOWN[language], ParseMode.HTML)
+    driver = webdriver.Chrome(f'../../res/chromedriver.exe', options=chrome_options)  # reused for the whole group
 
-
-def check_account_updates(user_login: str, user_password: str, options: tuple[int, int],
+    try:
+        for user_id, language, login, password, points_str in group:
+            subjects: list[str] = []
+            points: list[str] = []
+
+            try:
+                subjects_points = points_str.split('\n')
+            except AttributeError:  # if the student's account has never been checked
+                pass
+            else:  # if the student's account has been checked at least once
+                for subject_points in subjects_points:
+                    s, _, p = subject_points.partition(' ')
+                    subjects.append(s)
+                    points.append(p)
+
+            try:
+                try:
+                    updates[user_id] = (
+                        language, subjects, *check_account_updates(driver, login, password, options, points)
+                    )
+                except TimeoutException:
+                    bot.send_message(user_id, t.ECAMPUS_DOWN[language], ParseMode.HTML)
+
+                log_out(driver)
+            except (WebDriverException, IndexError, ValueError):  # if the account cannot be checked, the rest still are
+                log.nl.exception(log.ECAMPUS_CHECK_FAILS, user_id)
+    finally:
+        driver.quit()  # the browser is not left running even if checking the group fails
+
+
+def check_account_updates(driver: webdriver.Chrome, user_login: str, user_password: str, options: tuple[int, int],
                           current_points: list[str]) -> tuple[list[str], list[float], list[str]]:
     """
     Args:
+        driver (selenium.webdriver.Chrome): browser that the student's account will be checked in.
         user_login (str): login of the student's account.
         user_password (str): password to the student's account.
         options (tuple[int, int]): ids of options (year and term) that will be selected to filter out irrelevant
@@ -219,7 +245,6 @@ def check_account_updates(user_login: str, user_password: str, options: tuple[in
     Returns (tuple[list[str], list[float], list[str]]): the student's current points, difference between each subject's
         current points and yesterday ones, abbreviated subjects that have just been added to E-Campus.
     """
-    driver = webdriver.Chrome(f'../../res/chromedriver.exe')
     driver.get(c.ECAMPUS_URL)  # opening the login form
 
     login, password = driver.find_elements(By.CLASS_NAME, 'form-control')
@@ -240,20 +265,17 @@ def check_account_updates(user_login: str, user_password: str, options: tuple[in
     term_option = available_options[options[1]]
     term_option.click()  # selecting the current term's subjects
 
-    num_subjects = 0
+    subject_urls = []
     for subject in driver.find_element(By.CLASS_NAME, 'ListBox').find_elements(By.TAG_NAME, 'a')[::-1]:
         if subject.is_displayed():  # if the subject is relevant
-            subject.send_keys(Keys.CONTROL + Keys.RETURN)  # opening the subject in a new tab
-            num_subjects += 1
+            subject_urls.append(subject.get_attribute('href'))
         else:  # if the subject is irrelevant
-            break  # all relevant subjects have been opened in a new tab
+            break  # all relevant subjects have been collected
 
-    range_subjects = range(num_subjects)
     points, changes, new = [], [], []
 
-    for index in range_subjects:
-        driver.close()  # closing the current tab
-        driver.switch_to.window(driver.window_handles[0])  # switching to the last relevant subject's tab
+    for index, subject_url in enumerate(subject_urls):
+        driver.get(subject_url)  # opening the subject in the same tab
 
         subject_points = driver.find_element(By.ID, 'tabs-0').find_element(By.TAG_NAME, 'b').text
         points.append(subject_points)
@@ -263,22 +285,30 @@ def check_account_updates(user_login: str, user_password: str, options: tuple[in
         except IndexError:  # if the event has just been added
             new.append(abbreviate(driver.find_element(By.CLASS_NAME, 'head').find_elements(By.TAG_NAME, 'b')[1].text))
 
-    driver.quit()
     return points, changes, new
 
 
 def wait(driver, until: tuple[str, str]) -> WebElement:
-    try:
-        return WebDriverWait(driver, c.ECAMPUS_WAIT).until(expected_conditions.presence_of_element_located(until))
-    except TimeoutException:
-        driver.quit()
-        raise TimeoutException
+    return WebDriverWait(driver, c.ECAMPUS_WAIT).until(expected_conditions.presence_of_element_located(until))
+
+
+def log_out(driver: webdriver.Chrome):
+    """
+    This function clears the browser's cookies and storage of the current page, so that the next student's account is
+    checked in the same browser without a session of the previous one.
+
+    Args:
+        driver (selenium.webdriver.Chrome): browser that a student's account has been checked in.
+    """
+    driver.execute_script('window.localStorage.clear(); window.sessionStorage.clear();')
+    driver.execute_cdp_cmd('Network.clearBrowserCookies', {})  # cookies of all domains
 
 
 def abbreviate(subject: str) -> str:
     name = subject.partition('.')[0] if '.' in subject else subject.partition(',')[0]
 
-    ignored = ('та', 'і', 'й', 'до', 'за')
-    abbreviation = ''.join(word[0] for word in name.replace('-', ' ').split() if word not in ignored).upper()
+    abbreviation = ''.join(
+        word[0] for word in name.replace('-', ' ').split() if word not in ABBREVIATION_IGNORED_WORDS
+    ).upper()
 
     return abbreviation
@@ -13,6 +13,7 @@ WEEKDAYS = (
     ('Сб', 'Sat', 'Сб'),
     ('Нд', 'Sun', 'Вс')
 )
+LANGUAGE_WEEKDAYS = tuple(zip(*WEEKDAYS))  # the same weekdays by languages, so a language's ones are taken at once
 PRIVATE_INTERACTION = (
     '',
     'PRIVATE_INTERACTION',
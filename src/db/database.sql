@@ -22,12 +22,14 @@ CREATE TABLE "chats" (
 	"language" INTEGER NOT NULL,
 	"group_id" INTEGER NOT NULL,
 	"role" INTEGER,
-	"familiarity" TEXT,
+	"familiarity" INTEGER,
 	"feedback" TEXT,
 	"registered" TEXT NOT NULL,
 	PRIMARY KEY("id")
 );
 
+CREATE INDEX "chats_group_type" ON "chats" ("group_id", "type");
+
 CREATE TABLE "ecampus" (
 	"id" INTEGER NOT NULL UNIQUE,
 	"login" TEXT NOT NULL UNIQUE,